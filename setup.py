@@ -8,6 +8,26 @@ extensions = [
         ["src/dual_autodiff_x/dual.pyx"],
         include_dirs=[np.get_include()],
     ),
+    Extension(
+        "dual_autodiff_x.linalg",
+        ["src/dual_autodiff_x/linalg.pyx"],
+        include_dirs=[np.get_include()],
+    ),
+    Extension(
+        "dual_autodiff_x.control",
+        ["src/dual_autodiff_x/control.pyx"],
+        include_dirs=[np.get_include()],
+    ),
+    Extension(
+        "dual_autodiff_x.ode",
+        ["src/dual_autodiff_x/ode.pyx"],
+        include_dirs=[np.get_include()],
+    ),
+    Extension(
+        "dual_autodiff_x.optimize",
+        ["src/dual_autodiff_x/optimize.pyx"],
+        include_dirs=[np.get_include()],
+    ),
 ]
 
 setup(
@@ -19,7 +39,7 @@ setup(
         extensions,
         compiler_directives={"language_level": "3"}  # ensure Python 3 semantics
     ),
-    package_data={"dual_autodiff_x": ["*.so", "*.pyd"]},
+    package_data={"dual_autodiff_x": ["*.so", "*.pyd", "*.pxd"]},  # Ship .pxd headers for cimport
     exclude_package_data={"dual_autodiff_x": ["*.pyx", "*.py"]},
     zip_safe=False,
 )
@@ -0,0 +1,2 @@
+# Allows `cimport dual_autodiff_x` to reach the C-level API declared in dual.pxd
+from dual_autodiff_x.dual cimport *
@@ -0,0 +1,119 @@
+import numpy as np
+from dual_autodiff_x.dual import _parts, _wrap
+
+__all__ = ['where', 'maximum', 'minimum', 'clip', 'piecewise']
+
+
+def where(condition, x, y):
+    """Select elements from two dual arrays without branching.
+
+    Args:
+        condition (array-like of bool): Where True, take elements from `x`, otherwise from `y`. Typically the
+            result of comparing Dual_x_array objects, which compare their real parts.
+        x (Dual_x, Dual_x_array, or array-like): Values selected where `condition` is True.
+        y (Dual_x, Dual_x_array, or array-like): Values selected where `condition` is False.
+
+    Returns:
+        Dual_x or Dual_x_array: The selection. Each dual part comes from the selected branch, so plain
+        arrays contribute a zero dual part.
+    """
+    xr, xd = _parts(x)
+    yr, yd = _parts(y)
+    if xd is None and yd is None:
+        dual = None
+    else:
+        dual = np.where(condition, 0.0 if xd is None else xd, 0.0 if yd is None else yd)
+    return _wrap(np.where(condition, xr, yr), dual)
+
+
+def maximum(x, y):
+    """Element-wise maximum of two dual arrays, compared on their real parts.
+
+    Ties take the dual part of `x`.
+
+    Args:
+        x (Dual_x, Dual_x_array, or array-like): The first operand.
+        y (Dual_x, Dual_x_array, or array-like): The second operand.
+
+    Returns:
+        Dual_x or Dual_x_array: The element-wise maximum.
+    """
+    return where(_parts(x)[0] >= _parts(y)[0], x, y)
+
+
+def minimum(x, y):
+    """Element-wise minimum of two dual arrays, compared on their real parts.
+
+    Ties take the dual part of `x`.
+
+    Args:
+        x (Dual_x, Dual_x_array, or array-like): The first operand.
+        y (Dual_x, Dual_x_array, or array-like): The second operand.
+
+    Returns:
+        Dual_x or Dual_x_array: The element-wise minimum.
+    """
+    return where(_parts(x)[0] <= _parts(y)[0], x, y)
+
+
+def clip(x, lower, upper):
+    """Clip the real part of a dual array to an interval.
+
+    Clipped elements take the dual part of the bound they were clipped to, which is zero for plain
+    scalar or array bounds.
+
+    Args:
+        x (Dual_x or Dual_x_array): The dual array to clip.
+        lower (Dual_x, Dual_x_array, or array-like): The lower bound.
+        upper (Dual_x, Dual_x_array, or array-like): The upper bound.
+
+    Returns:
+        Dual_x or Dual_x_array: The clipped dual array.
+    """
+    return minimum(maximum(x, lower), upper)
+
+
+def piecewise(x, condlist, funclist):
+    """Evaluate a piecewise-defined function on a dual array.
+
+    Follows ``numpy.piecewise``: each function is evaluated only on the elements selected by its
+    condition, so a branch is never evaluated outside its domain. If `funclist` has one more entry than
+    `condlist`, the extra entry is used where no condition holds.
+
+    Args:
+        x (Dual_x or Dual_x_array): The dual array.
+        condlist (list of array-like of bool): The conditions, each with the same shape as `x`.
+        funclist (list of callable or float): The branches. A callable receives a Dual_x_array holding the
+            selected elements and returns a dual result of the same length. A scalar is a constant branch.
+
+    Returns:
+        Dual_x or Dual_x_array: The piecewise result. Elements matching no condition are zero.
+
+    Raises:
+        ValueError: If `funclist` does not have ``len(condlist)`` or ``len(condlist) + 1`` entries.
+    """
+    xr, xd = _parts(x)
+    if xd is None:
+        xd = np.zeros_like(xr)
+    condlist = [np.asarray(c, dtype=bool) for c in condlist]
+    if len(funclist) == len(condlist) + 1:
+        otherwise = ~np.any(condlist, axis=0) if condlist else np.ones(xr.shape, dtype=bool)
+        condlist.append(otherwise)
+    elif len(funclist) != len(condlist):
+        raise ValueError(
+            f"Expected {len(condlist)} or {len(condlist) + 1} functions, got {len(funclist)}"
+        )
+
+    real = np.zeros_like(xr)
+    dual = np.zeros_like(xd)
+    for cond, f in zip(condlist, funclist):
+        if not np.any(cond):
+            continue
+        if callable(f):
+            br, bd = _parts(f(_wrap(xr[cond], xd[cond])))
+            real[cond] = br
+            dual[cond] = 0.0 if bd is None else bd
+        else:
+            real[cond] = f
+            dual[cond] = 0.0
+    return _wrap(real, dual)
@@ -0,0 +1,91 @@
+# C-level API of dual_autodiff_x.dual.
+#
+# Downstream Cython code can use the dual kernels below in tight loops without touching Python objects:
+#
+#     from dual_autodiff_x cimport dual_t, dual_new, dual_mul, dual_sin
+#
+#     cdef dual_t y = dual_mul(dual_sin(x), x)
+#
+# The kernels are inline, nogil and perform no domain checks: unlike Dual_x.log and Dual_x.tan, they do not
+# raise or warn near the singularities of log and tan, so callers must check their inputs themselves.
+
+from libc.math cimport sin, cos, tan, log, exp, pow
+
+
+ctypedef struct dual_t:
+    double real
+    double dual
+
+
+cdef class Dual_x:
+    cdef public object real
+    cdef public object dual
+
+    cpdef Dual_x sin(self)
+    cpdef Dual_x cos(self)
+    cpdef Dual_x tan(self)
+    cpdef Dual_x log(self)
+    cpdef Dual_x exp(self)
+
+
+cdef class Dual_x_array:
+    cdef public object real
+    cdef public object dual
+    cdef object _pool
+
+    cpdef Dual_x_array sin(self)
+    cpdef Dual_x_array cos(self)
+    cpdef Dual_x_array tan(self)
+    cpdef Dual_x_array log(self)
+    cpdef Dual_x_array exp(self)
+
+
+cdef inline dual_t dual_new(double real, double dual) noexcept nogil:
+    cdef dual_t out
+    out.real = real
+    out.dual = dual
+    return out
+
+
+cdef inline dual_t dual_add(dual_t a, dual_t b) noexcept nogil:
+    return dual_new(a.real + b.real, a.dual + b.dual)
+
+
+cdef inline dual_t dual_sub(dual_t a, dual_t b) noexcept nogil:
+    return dual_new(a.real - b.real, a.dual - b.dual)
+
+
+cdef inline dual_t dual_mul(dual_t a, dual_t b) noexcept nogil:
+    return dual_new(a.real * b.real, a.real * b.dual + a.dual * b.real)
+
+
+cdef inline dual_t dual_pow(dual_t a, double exponent) noexcept nogil:
+    return dual_new(pow(a.real, exponent), exponent * pow(a.real, exponent - 1) * a.dual)
+
+
+cdef inline dual_t dual_abs(dual_t a) noexcept nogil:
+    if a.real >= 0:
+        return a
+    return dual_new(-a.real, -a.dual)
+
+
+cdef inline dual_t dual_sin(dual_t a) noexcept nogil:
+    return dual_new(sin(a.real), cos(a.real) * a.dual)
+
+
+cdef inline dual_t dual_cos(dual_t a) noexcept nogil:
+    return dual_new(cos(a.real), -sin(a.real) * a.dual)
+
+
+cdef inline dual_t dual_tan(dual_t a) noexcept nogil:
+    cdef double c = cos(a.real)
+    return dual_new(tan(a.real), a.dual / (c * c))
+
+
+cdef inline dual_t dual_log(dual_t a) noexcept nogil:
+    return dual_new(log(a.real), a.dual / a.real)
+
+
+cdef inline dual_t dual_exp(dual_t a) noexcept nogil:
+    cdef double val = exp(a.real)
+    return dual_new(val, val * a.dual)
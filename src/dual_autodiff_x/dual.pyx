@@ -1,6 +1,11 @@
 from libc.math cimport sin, cos, tan, log, exp, pow
 import numpy as np
 cimport numpy as cnp
+cimport cython
+from cpython.object cimport PyObject
+from cpython.ref cimport _Py_REFCNT
+from cpython.contextvars cimport get_value
+import contextvars
 import warnings
 
 __all__ = ['Dual_x']  # Only expose Dual_x to sphinx
@@ -25,8 +30,7 @@ cdef class Dual_x:
 
         This formula describes how dual numbers are processed through a given mathematical function \(f\).
     """
-    cdef public object real  # Allow scalars or arrays
-    cdef public object dual
+    # Attributes (real, dual) are declared in dual.pxd
 
     def __cinit__(self, real, dual):
         """Initialize an object of the Dual_x class.
@@ -106,6 +110,25 @@ cdef class Dual_x:
             self.real * other.dual + self.dual * other.real
         )
 
+    def __matmul__(self, other):
+        """Matrix-multiply two Dual_x numbers holding arrays.
+
+        Operator:
+            Uses the :math:`@` operator.
+
+        Returns:
+            Dual_x or Dual_x_array: The matrix product, see :func:`dual_autodiff_x.linalg.matmul`.
+        """
+        from dual_autodiff_x.linalg import matmul
+        return matmul(self, other)
+
+    def __rmatmul__(self, other):
+        from dual_autodiff_x.linalg import matmul
+        return matmul(other, self)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        return _array_ufunc(ufunc, method, inputs, kwargs)
+
     def __pow__(self, exponent):
         """Raise a Dual_x number to a power.
 
@@ -129,6 +152,41 @@ cdef class Dual_x:
                 exponent * pow(self.real, exponent - 1) * self.dual
             )
 
+    def __abs__(self):
+        """Compute the absolute value of the Dual_x number.
+
+        Returns:
+            Dual_x: A new Dual_x number. The dual part is negated where the real part is negative; at zero
+            the dual part is passed through unchanged.
+        """
+        if isinstance(self.real, np.ndarray):
+            return Dual_x(np.abs(self.real), np.where(self.real >= 0, self.dual, -self.dual))
+        elif self.real >= 0:
+            return Dual_x(self.real, self.dual)
+        else:
+            return Dual_x(-self.real, -self.dual)
+
+    def __lt__(self, other):
+        """Compare the real parts with the :math:`<` operator.
+
+        Returns:
+            bool or numpy.ndarray: The element-wise comparison of the real parts. The dual parts are ignored.
+        """
+        return self.real < _real_of(other)
+
+    def __le__(self, other):
+        return self.real <= _real_of(other)
+
+    def __gt__(self, other):
+        return self.real > _real_of(other)
+
+    def __ge__(self, other):
+        return self.real >= _real_of(other)
+
+    def __hash__(self):
+        # Defining comparisons drops the inherited hash; keep hashing by identity, as == still compares identity
+        return object.__hash__(self)
+
     cpdef Dual_x sin(self):
         """Compute the sine of the Dual_x number.
 
@@ -263,9 +321,203 @@ cdef class Dual_x:
 
 
 
+cdef class BufferPool:
+    """A pool of reusable float64 buffers for Dual_x_array results.
+
+    While a pool is active, the results of Dual_x_array arithmetic and elementary functions draw their
+    real and dual arrays from it, and hand them back when the result is garbage-collected. Requests are
+    rounded up to power-of-two size classes so that buffers can be reused across slightly different
+    lengths. A buffer is only reused once nothing else references it, so keeping e.g. ``y.real`` alive
+    after ``y`` is gone is always safe: the pool keeps track of the buffer and takes it back once the
+    caller drops it.
+
+    Use the pool as a context manager; pools may be nested, and leaving a pool releases all buffers it
+    holds. The active pool is a context variable, so a pool only serves the thread (or asyncio task) that
+    entered it.
+
+    Attributes:
+        max_bytes (int): Cap on the memory held in free buffers. When returning a buffer would exceed it,
+            free buffers of the largest size classes are evicted first.
+        min_size (int): Arrays shorter than this bypass the pool, since small allocations are cheap.
+
+    Example:
+        >>> with BufferPool(max_bytes=2**28) as pool:
+        ...     y = (x.sin() * x + x.exp()).log()
+        >>> pool.stats()['reuse_rate']
+    """
+    cdef public Py_ssize_t max_bytes
+    cdef public Py_ssize_t min_size
+    cdef dict free
+    cdef list lent  # Buffers whose results died while their arrays were still referenced elsewhere
+    cdef Py_ssize_t sweep_at  # Length `lent` must reach before acquire sweeps it again
+    cdef bint active
+    cdef object token  # Restores the previously active pool on exit
+    cdef Py_ssize_t requests, reuses, evictions, held_bytes, in_use_bytes, peak_bytes
+
+    def __cinit__(self, Py_ssize_t max_bytes=256 * 2 ** 20, Py_ssize_t min_size=1024):
+        """Initialize the pool.
+
+        Args:
+            max_bytes (int, optional): Cap on the memory held in free buffers. Defaults to 256 MiB.
+            min_size (int, optional): Minimum array length served from the pool.
+
+        Raises:
+            ValueError: If `max_bytes` is negative or `min_size` is less than 1.
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes cannot be negative.")
+        if min_size < 1:
+            raise ValueError("min_size must be at least 1.")
+        self.max_bytes = max_bytes
+        self.min_size = min_size
+        self.free = {}
+        self.lent = []
+        self.sweep_at = 1
+        self.active = False
+        self.token = None
+        self.requests = self.reuses = self.evictions = 0
+        self.held_bytes = self.in_use_bytes = self.peak_bytes = 0
+
+    def __enter__(self):
+        if self.active:
+            raise RuntimeError("BufferPool is already active.")
+        self.token = _active_pool.set(self)
+        self.active = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _active_pool.reset(self.token)
+        self.token = None
+        self.active = False
+        self.clear()
+        # Buffers still referenced by the caller are no longer tracked once the pool is closed
+        for buffer in self.lent:
+            self.in_use_bytes -= buffer.shape[0] * 8
+        self.lent = []
+        self.sweep_at = 1
+        return False
+
+    def clear(self):
+        """Release all free buffers held by the pool."""
+        self.free.clear()
+        self.held_bytes = 0
+
+    def stats(self):
+        """Return the pool statistics.
+
+        Returns:
+            dict: The number of ``requests`` and ``reuses``, the ``reuse_rate``, the number of
+            ``evictions``, the bytes currently ``held`` in free buffers and ``in_use`` by live arrays, and
+            the ``peak_bytes`` footprint of both together.
+        """
+        self._sweep()
+        return {
+            'requests': self.requests,
+            'reuses': self.reuses,
+            'reuse_rate': self.reuses / self.requests if self.requests else 0.0,
+            'evictions': self.evictions,
+            'held_bytes': self.held_bytes,
+            'in_use_bytes': self.in_use_bytes,
+            'peak_bytes': self.peak_bytes,
+        }
+
+    cdef cnp.ndarray acquire(self, Py_ssize_t n):
+        """Return an uninitialized array of length `n` viewing a pooled buffer."""
+        cdef Py_ssize_t size = 1
+        while size < n:
+            size <<= 1
+        bucket = self.free.get(size)
+        if not bucket and len(self.lent) >= self.sweep_at:
+            # Only sweep once `lent` has doubled, so results kept alive by the caller cost amortized O(1)
+            self._sweep()
+            bucket = self.free.get(size)
+        if bucket:
+            base = bucket.pop()
+            self.held_bytes -= size * 8
+            self.reuses += 1
+        else:
+            base = np.empty(size, dtype=np.float64)
+        self.requests += 1
+        self.in_use_bytes += size * 8
+        self.peak_bytes = max(self.peak_bytes, self.in_use_bytes + self.held_bytes)
+        return base[:n]
+
+    cdef void reclaim(self, cnp.ndarray view):
+        """Take back the buffer behind `view`, or keep track of it if something else still references it."""
+        cdef PyObject* base = cnp.PyArray_BASE(view)
+        if base == NULL:
+            return
+        buffer = <object> base
+        # One reference from the dying Dual_x_array (plus the argument), one from the view to its base
+        if _Py_REFCNT(<PyObject*> view) > 2 or _Py_REFCNT(base) > 2:
+            if self.active:
+                self.lent.append(buffer)
+            else:
+                self.in_use_bytes -= buffer.shape[0] * 8
+            return
+        self._release(buffer)
+
+    cdef void _sweep(self):
+        """Take back lent buffers that are now referenced only by the pool."""
+        cdef list still_lent = []
+        for buffer in self.lent:
+            # One reference from self.lent, one from the loop variable
+            if _Py_REFCNT(<PyObject*> buffer) > 2:
+                still_lent.append(buffer)
+            else:
+                self._release(buffer)
+        self.lent = still_lent
+        self.sweep_at = max(1, 2 * len(still_lent))
+
+    cdef void _release(self, buffer):
+        """Return an unreferenced buffer to its free list, subject to the memory cap."""
+        cdef Py_ssize_t nbytes = buffer.shape[0] * 8
+        self.in_use_bytes -= nbytes
+        if not self.active or nbytes > self.max_bytes:
+            return
+        while self.held_bytes + nbytes > self.max_bytes:
+            self._evict_largest()
+        self.free.setdefault(buffer.shape[0], []).append(buffer)
+        self.held_bytes += nbytes
+
+    cdef void _evict_largest(self):
+        largest = max(size for size, bucket in self.free.items() if bucket)
+        self.free[largest].pop()
+        self.held_bytes -= largest * 8
+        self.evictions += 1
+
+
+_active_pool = contextvars.ContextVar('dual_autodiff_x_buffer_pool', default=None)
+
+
+cdef inline bint _pooled(Py_ssize_t n):
+    """Return whether a result of length `n` would be drawn from the active pool."""
+    cdef BufferPool pool = get_value(_active_pool)
+    return pool is not None and n >= pool.min_size
+
+
+cdef inline Py_ssize_t _broadcast_length(Py_ssize_t n1, Py_ssize_t n2) except -1:
+    """Return the length two 1D operands broadcast to, as ``np.broadcast_shapes`` would."""
+    if n1 == n2 or n2 == 1:
+        return n1
+    if n1 == 1:
+        return n2
+    raise ValueError(f"operands could not be broadcast together with lengths {n1} and {n2}")
+
+
+cdef Dual_x_array _empty_result(Py_ssize_t n):
+    """Create a Dual_x_array with uninitialized parts of length `n`, drawn from the active pool if any."""
+    cdef Dual_x_array result
+    cdef BufferPool pool = get_value(_active_pool)
+    if pool is None or n < pool.min_size:
+        return Dual_x_array(np.empty(n, dtype=np.float64), np.empty(n, dtype=np.float64))
+    result = Dual_x_array(pool.acquire(n), pool.acquire(n))
+    result._pool = pool
+    return result
+
+
 cdef class Dual_x_array:
-    cdef public object real  # Store real as Python object
-    cdef public object dual  # Store dual as Python object
+    # Attributes (real, dual, and the pool the parts were drawn from) are declared in dual.pxd
 
     def __cinit__(self, cnp.ndarray[cnp.float64_t, ndim=1] real, cnp.ndarray[cnp.float64_t, ndim=1] dual):
         """
@@ -294,13 +546,96 @@ cdef class Dual_x_array:
                 f"Shape mismatch: real.shape={real.shape[0]}, dual.shape={dual.shape[0]}"
             )
 
+    def __dealloc__(self):
+        if self._pool is not None:
+            (<BufferPool> self._pool).reclaim(self.real)
+            (<BufferPool> self._pool).reclaim(self.dual)
+
+    def __len__(self):
+        return self.real.shape[0]
+
+    def __getitem__(self, index):
+        """Index the Dual_x_array.
+
+        Args:
+            index (int, slice, or array-like): An integer, a slice, or an integer or boolean index array.
+
+        Returns:
+            Dual_x or Dual_x_array: A scalar Dual_x for an integer index. A slice returns a Dual_x_array
+            viewing the same memory as this one. Index arrays gather both parts in a single fused pass
+            into a new Dual_x_array.
+
+        Raises:
+            IndexError: If the index is out of bounds or of an unsupported type.
+        """
+        if isinstance(index, (int, np.integer)) and not isinstance(index, bool):
+            return Dual_x(float(self.real[index]), float(self.dual[index]))
+        if isinstance(index, slice):
+            return Dual_x_array(self.real[index], self.dual[index])
+
+        idx = _as_indices(index, self.real.shape[0])
+        out_r = np.empty(idx.shape[0], dtype=np.float64)
+        out_d = np.empty(idx.shape[0], dtype=np.float64)
+        _gather(self.real, self.dual, idx, out_r, out_d)
+        return Dual_x_array(out_r, out_d)
+
+    def __setitem__(self, index, value):
+        """Assign to elements of the Dual_x_array in place.
+
+        Args:
+            index (int, slice, or array-like): An integer, a slice, or an integer or boolean index array.
+            value (Dual_x, Dual_x_array, or array-like): The values to assign, broadcast to the indexed
+                elements. Plain scalars and arrays are assigned a zero dual part.
+
+        Raises:
+            IndexError: If the index is out of bounds or of an unsupported type.
+        """
+        r, d = _parts(value)
+        if isinstance(index, (int, np.integer, slice)) and not isinstance(index, bool):
+            self.real[index] = r
+            self.dual[index] = 0.0 if d is None else d
+            return
+
+        idx = _as_indices(index, self.real.shape[0])
+        value_r = np.broadcast_to(r, (idx.shape[0],))
+        value_d = np.broadcast_to(0.0 if d is None else d, (idx.shape[0],))
+        # _scatter reads the values while writing, so values viewing this array (e.g. x[::-1]) must be copied
+        if _overlaps(value_r, self) or _overlaps(value_d, self):
+            value_r = value_r.copy()
+            value_d = value_d.copy()
+        _scatter(self.real, self.dual, idx, value_r, value_d)
+
+    def reshape(self, *shape):
+        """Reshape the Dual_x_array, returning a view where NumPy can.
+
+        Args:
+            *shape (int or tuple of int): The new shape, as accepted by ``numpy.reshape``.
+
+        Returns:
+            Dual_x or Dual_x_array: A Dual_x_array for a 1D shape, otherwise a Dual_x.
+        """
+        if len(shape) == 1:
+            shape = shape[0]
+        r = self.real.reshape(shape)
+        d = self.dual.reshape(shape)
+        if r.ndim == 1:
+            return Dual_x_array(r, d)
+        return Dual_x(r, d)
+
     def __add__(self, other):
         cdef cnp.ndarray[cnp.float64_t, ndim=1] r1 = self.real
         cdef cnp.ndarray[cnp.float64_t, ndim=1] d1 = self.dual
         cdef cnp.ndarray[cnp.float64_t, ndim=1] r2 = other.real
         cdef cnp.ndarray[cnp.float64_t, ndim=1] d2 = other.dual
 
-        return Dual_x_array(r1 + r2, d1 + d2)
+        cdef Py_ssize_t n = _broadcast_length(r1.shape[0], r2.shape[0])
+        if not _pooled(n):
+            return Dual_x_array(r1 + r2, d1 + d2)
+
+        cdef Dual_x_array out = _empty_result(n)
+        np.add(r1, r2, out=out.real)
+        np.add(d1, d2, out=out.dual)
+        return out
 
     def __sub__(self, other):
         cdef cnp.ndarray[cnp.float64_t, ndim=1] r1 = self.real
@@ -308,7 +643,14 @@ cdef class Dual_x_array:
         cdef cnp.ndarray[cnp.float64_t, ndim=1] r2 = other.real
         cdef cnp.ndarray[cnp.float64_t, ndim=1] d2 = other.dual
 
-        return Dual_x_array(r1 - r2, d1 - d2)
+        cdef Py_ssize_t n = _broadcast_length(r1.shape[0], r2.shape[0])
+        if not _pooled(n):
+            return Dual_x_array(r1 - r2, d1 - d2)
+
+        cdef Dual_x_array out = _empty_result(n)
+        np.subtract(r1, r2, out=out.real)
+        np.subtract(d1, d2, out=out.dual)
+        return out
 
     def __mul__(self, other):
         cdef cnp.ndarray[cnp.float64_t, ndim=1] r1 = self.real
@@ -316,28 +658,97 @@ cdef class Dual_x_array:
         cdef cnp.ndarray[cnp.float64_t, ndim=1] r2 = other.real
         cdef cnp.ndarray[cnp.float64_t, ndim=1] d2 = other.dual
 
-        return Dual_x_array(r1 * r2, r1 * d2 + d1 * r2)
+        cdef Py_ssize_t n = _broadcast_length(r1.shape[0], r2.shape[0])
+        if not _pooled(n):
+            return Dual_x_array(r1 * r2, r1 * d2 + d1 * r2)
+
+        cdef Dual_x_array out = _empty_result(n)
+        # Use the real part of the output as scratch for d1 * r2 before it is overwritten
+        np.multiply(r1, d2, out=out.dual)
+        np.multiply(d1, r2, out=out.real)
+        out.dual += out.real
+        np.multiply(r1, r2, out=out.real)
+        return out
+
+    def __matmul__(self, other):
+        from dual_autodiff_x.linalg import matmul
+        return matmul(self, other)
+
+    def __rmatmul__(self, other):
+        from dual_autodiff_x.linalg import matmul
+        return matmul(other, self)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        return _array_ufunc(ufunc, method, inputs, kwargs)
 
     def __pow__(self, double exponent):
         cdef cnp.ndarray[cnp.float64_t, ndim=1] r = self.real
         cdef cnp.ndarray[cnp.float64_t, ndim=1] d = self.dual
 
-        return Dual_x_array(
-            np.power(r, exponent),
-            exponent * np.power(r, exponent - 1) * d
-        )
+        if not _pooled(r.shape[0]):
+            return Dual_x_array(np.power(r, exponent), exponent * np.power(r, exponent - 1) * d)
+
+        cdef Dual_x_array out = _empty_result(r.shape[0])
+        np.power(r, exponent - 1, out=out.dual)
+        out.dual *= exponent
+        out.dual *= d
+        np.power(r, exponent, out=out.real)
+        return out
+
+    def __abs__(self):
+        cdef cnp.ndarray[cnp.float64_t, ndim=1] r = self.real
+        cdef cnp.ndarray[cnp.float64_t, ndim=1] d = self.dual
+
+        if not _pooled(r.shape[0]):
+            return Dual_x_array(np.abs(r), np.where(r >= 0, d, -d))
+
+        cdef Dual_x_array out = _empty_result(r.shape[0])
+        np.negative(d, out=out.dual)
+        np.copyto(out.dual, d, where=r >= 0)
+        np.abs(r, out=out.real)
+        return out
+
+    def __lt__(self, other):
+        return np.less(self.real, _real_of(other))
+
+    def __le__(self, other):
+        return np.less_equal(self.real, _real_of(other))
+
+    def __gt__(self, other):
+        return np.greater(self.real, _real_of(other))
+
+    def __ge__(self, other):
+        return np.greater_equal(self.real, _real_of(other))
+
+    def __hash__(self):
+        return object.__hash__(self)
 
     cpdef Dual_x_array sin(self):
         cdef cnp.ndarray[cnp.float64_t, ndim=1] r = self.real
         cdef cnp.ndarray[cnp.float64_t, ndim=1] d = self.dual
 
-        return Dual_x_array(np.sin(r), np.cos(r) * d)
+        if not _pooled(r.shape[0]):
+            return Dual_x_array(np.sin(r), np.cos(r) * d)
+
+        cdef Dual_x_array out = _empty_result(r.shape[0])
+        np.cos(r, out=out.dual)
+        out.dual *= d
+        np.sin(r, out=out.real)
+        return out
 
     cpdef Dual_x_array cos(self):
         cdef cnp.ndarray[cnp.float64_t, ndim=1] r = self.real
         cdef cnp.ndarray[cnp.float64_t, ndim=1] d = self.dual
 
-        return Dual_x_array(np.cos(r), -np.sin(r) * d)
+        if not _pooled(r.shape[0]):
+            return Dual_x_array(np.cos(r), -np.sin(r) * d)
+
+        cdef Dual_x_array out = _empty_result(r.shape[0])
+        np.sin(r, out=out.dual)
+        np.negative(out.dual, out=out.dual)
+        out.dual *= d
+        np.cos(r, out=out.real)
+        return out
 
     cpdef Dual_x_array tan(self):
         cdef double tolerance_exception = 1e-10
@@ -351,10 +762,15 @@ cdef class Dual_x_array:
             raise ValueError("Real value too close to pi/2 + n*pi.")
         elif np.any((delta >= tolerance_exception) & (delta < tolerance_warning)):
             warnings.warn("Real value close to pi/2 + n*pi; numerical instability possible.", RuntimeWarning)
-        return Dual_x_array(
-            np.tan(self.real),
-            (1.0 / (np.cos(self.real) ** 2)) * self.dual
-        )
+        if not _pooled(self.real.shape[0]):
+            return Dual_x_array(np.tan(self.real), (1.0 / (np.cos(self.real) ** 2)) * self.dual)
+
+        cdef Dual_x_array out = _empty_result(self.real.shape[0])
+        np.cos(self.real, out=out.dual)
+        np.square(out.dual, out=out.dual)
+        np.divide(self.dual, out.dual, out=out.dual)
+        np.tan(self.real, out=out.real)
+        return out
     cpdef Dual_x_array log(self):
         """Compute the natural logarithm of the Dual_x_array.
 
@@ -381,15 +797,214 @@ cdef class Dual_x_array:
             warnings.warn("Log input close to zero; numerical instability possible.", RuntimeWarning)
 
         # Compute the log and return the result
-        return Dual_x_array(np.log(r), (1.0 / r) * d)
+        if not _pooled(r.shape[0]):
+            return Dual_x_array(np.log(r), (1.0 / r) * d)
+
+        cdef Dual_x_array out = _empty_result(r.shape[0])
+        np.divide(d, r, out=out.dual)
+        np.log(r, out=out.real)
+        return out
 
 
     cpdef Dual_x_array exp(self):
         cdef cnp.ndarray[cnp.float64_t, ndim=1] r = self.real
         cdef cnp.ndarray[cnp.float64_t, ndim=1] d = self.dual
 
-        val = np.exp(r)
-        return Dual_x_array(val, val * d)
+        if not _pooled(r.shape[0]):
+            val = np.exp(r)
+            return Dual_x_array(val, val * d)
+
+        cdef Dual_x_array out = _empty_result(r.shape[0])
+        np.exp(r, out=out.real)
+        np.multiply(out.real, d, out=out.dual)
+        return out
 
 
+def _parts(x):
+    """Split an operand into its real and dual parts.
 
+    Plain scalars and arrays are treated as constants, so their dual part is ``None``. This lets
+    contractions skip the products that would only multiply by zero.
+    """
+    if isinstance(x, (Dual_x, Dual_x_array)):
+        return np.asarray(x.real, dtype=np.float64), np.asarray(x.dual, dtype=np.float64)
+    return np.asarray(x, dtype=np.float64), None
+
+
+def _wrap(real, dual):
+    """Build the dual result matching the shape of `real`.
+
+    One-dimensional results are returned as Dual_x_array, everything else (scalars and matrices) as Dual_x.
+    """
+    if dual is None:
+        dual = np.zeros_like(real)
+    if isinstance(real, np.ndarray) and real.ndim == 0:
+        real, dual = float(real), float(dual)
+    elif isinstance(real, np.ndarray) and real.ndim == 1:
+        return Dual_x_array(
+            np.ascontiguousarray(real, dtype=np.float64),
+            np.ascontiguousarray(dual, dtype=np.float64)
+        )
+    elif not isinstance(real, np.ndarray):
+        real, dual = float(real), float(dual)
+    return Dual_x(real, dual)
+
+
+def _array_ufunc(ufunc, method, inputs, kwargs):
+    """Dispatch a NumPy ufunc called on dual operands.
+
+    ``np.matmul`` (and so ``ndarray @ dual``) goes to :func:`dual_autodiff_x.linalg.matmul`, and the unary
+    ufuncs with a dual counterpart go to the corresponding method. Anything else is left unsupported.
+    """
+    if method != '__call__' or kwargs:
+        return NotImplemented
+    if ufunc is np.matmul and len(inputs) == 2:
+        from dual_autodiff_x.linalg import matmul
+        return matmul(*inputs)
+    name = _UNARY_UFUNCS.get(ufunc)
+    if name is not None and len(inputs) == 1:
+        return getattr(inputs[0], name)()
+    return NotImplemented
+
+
+_UNARY_UFUNCS = {np.sin: 'sin', np.cos: 'cos', np.tan: 'tan', np.log: 'log', np.exp: 'exp'}
+
+
+def _real_of(x):
+    """Return the real part of a dual operand, or the operand itself if it is a plain scalar or array."""
+    if isinstance(x, (Dual_x, Dual_x_array)):
+        return x.real
+    return x
+
+
+def concatenate(arrays, axis=0, out=None):
+    """Join a sequence of dual arrays along an existing axis.
+
+    Both parts are written directly into a single destination, so no intermediate arrays are built.
+
+    Args:
+        arrays (sequence): Dual_x, Dual_x_array, or plain arrays (treated as constants) of matching shape
+            except along `axis`.
+        axis (int, optional): The axis to join along.
+        out (Dual_x or Dual_x_array, optional): A destination of the correct shape to write into.
+
+    Returns:
+        Dual_x or Dual_x_array: The joined array, or `out` if given.
+
+    Raises:
+        ValueError: If the shapes are incompatible or `out` has the wrong shape.
+    """
+    return _join([_parts(a) for a in arrays], axis, out)
+
+
+def stack(arrays, axis=0, out=None):
+    """Join a sequence of dual arrays along a new axis.
+
+    Args:
+        arrays (sequence): Dual_x, Dual_x_array, or plain arrays (treated as constants) of the same shape.
+        axis (int, optional): The position of the new axis in the result.
+        out (Dual_x or Dual_x_array, optional): A destination of the correct shape to write into.
+
+    Returns:
+        Dual_x or Dual_x_array: The stacked array, or `out` if given.
+
+    Raises:
+        ValueError: If the shapes differ or `out` has the wrong shape.
+    """
+    parts = [_parts(a) for a in arrays]
+    if not parts:
+        raise ValueError("Need at least one array to stack.")
+    expanded = []
+    for r, d in parts:
+        expanded.append((np.expand_dims(r, axis), None if d is None else np.expand_dims(d, axis)))
+    return _join(expanded, axis, out)
+
+
+def _join(parts, axis, out):
+    """Write the real and dual parts of `parts` side by side along `axis` into one destination."""
+    if not parts:
+        raise ValueError("Need at least one array to concatenate.")
+    first = parts[0][0]
+    if first.ndim == 0:
+        raise ValueError("Zero-dimensional arrays cannot be concatenated.")
+    if axis < 0:
+        axis += first.ndim
+    if not 0 <= axis < first.ndim:
+        raise ValueError(f"axis {axis} is out of bounds for arrays of dimension {first.ndim}")
+    outer_shape = first.shape[:axis] + first.shape[axis + 1:]
+    for r, _ in parts:
+        if r.ndim != first.ndim or r.shape[:axis] + r.shape[axis + 1:] != outer_shape:
+            raise ValueError("All input arrays must have the same shape except along the concatenation axis.")
+
+    shape = list(first.shape)
+    shape[axis] = sum(r.shape[axis] for r, _ in parts)
+    shape = tuple(shape)
+    if out is None:
+        dest_r = np.empty(shape, dtype=np.float64)
+        dest_d = np.empty(shape, dtype=np.float64)
+    else:
+        dest_r, dest_d = out.real, out.dual
+        if not isinstance(dest_r, np.ndarray) or dest_r.shape != shape:
+            raise ValueError(f"Output has the wrong shape, expected {shape}")
+
+    cdef Py_ssize_t offset = 0
+    for r, d in parts:
+        index = (slice(None),) * axis + (slice(offset, offset + r.shape[axis]),)
+        dest_r[index] = r
+        dest_d[index] = 0.0 if d is None else d
+        offset += r.shape[axis]
+
+    if out is not None:
+        return out
+    if dest_r.ndim == 1:
+        return Dual_x_array(dest_r, dest_d)
+    return Dual_x(dest_r, dest_d)
+
+
+cdef bint _overlaps(value, Dual_x_array x):
+    """Return whether `value` may share memory with either part of `x`."""
+    return np.may_share_memory(value, x.real) or np.may_share_memory(value, x.dual)
+
+
+cdef cnp.ndarray _as_indices(index, Py_ssize_t n):
+    """Convert an integer or boolean index array into validated, non-negative positions."""
+    arr = np.asarray(index)
+    if arr.shape == () and arr.dtype == np.bool_:
+        return np.arange(n if arr else 0, dtype=np.intp)  # A scalar True selects everything, as in NumPy
+    if arr.shape == (0,) and arr.dtype != np.bool_:
+        return np.empty(0, dtype=np.intp)  # np.asarray([]) is float64, but selects nothing as in NumPy
+    if arr.dtype == np.bool_:
+        if arr.shape != (n,):
+            raise IndexError(f"Boolean index of shape {arr.shape} does not match array of length {n}")
+        return np.flatnonzero(arr)
+    if arr.ndim != 1 or not np.issubdtype(arr.dtype, np.integer):
+        raise IndexError("Only integers, slices and 1D integer or boolean arrays are valid indices.")
+    idx = arr.astype(np.intp)  # Always a copy, so wrapping negatives never touches the caller's array
+    idx[idx < 0] += n
+    if idx.shape[0] and (idx.min() < 0 or idx.max() >= n):
+        raise IndexError(f"Index out of bounds for array of length {n}")
+    return idx
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _gather(const double[:] r, const double[:] d, const Py_ssize_t[:] idx,
+                  double[:] out_r, double[:] out_d) noexcept nogil:
+    """Gather both parts at the validated positions `idx` in one pass."""
+    cdef Py_ssize_t k, j
+    for k in range(idx.shape[0]):
+        j = idx[k]
+        out_r[k] = r[j]
+        out_d[k] = d[j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _scatter(double[:] r, double[:] d, const Py_ssize_t[:] idx,
+                   const double[:] value_r, const double[:] value_d) noexcept nogil:
+    """Scatter both parts to the validated positions `idx` in one pass."""
+    cdef Py_ssize_t k, j
+    for k in range(idx.shape[0]):
+        j = idx[k]
+        r[j] = value_r[k]
+        d[j] = value_d[k]
@@ -0,0 +1,272 @@
+import warnings
+import numpy as np
+from dual_autodiff_x.dual import _parts, _wrap
+
+__all__ = ['sum', 'mean', 'dot', 'matmul', 'outer', 'norm', 'solve', 'cholesky_solve', 'lstsq']
+
+
+cdef object _product(f, ar, ad, br, bd):
+    """Apply a bilinear product `f` to two dual operands.
+
+    The real part is ``f(a, b)`` and the dual part is ``f(a, db) + f(da, b)``, each term being a single
+    BLAS call. Terms involving a constant operand are skipped.
+    """
+    real = f(ar, br)
+    if ad is None and bd is None:
+        return _wrap(real, None)
+    if ad is None:
+        return _wrap(real, f(ar, bd))
+    if bd is None:
+        return _wrap(real, f(ad, br))
+
+    dual = f(ar, bd)
+    if isinstance(dual, np.ndarray):
+        dual += f(ad, br)  # Accumulate in place to avoid a third temporary
+    else:
+        dual = dual + f(ad, br)
+    return _wrap(real, dual)
+
+
+def sum(x, axis=None):
+    """Sum the elements of a dual array.
+
+    Args:
+        x (Dual_x or Dual_x_array): The dual array to reduce.
+        axis (int or tuple of int, optional): Axis or axes along which to sum. Sums all elements by default.
+
+    Returns:
+        Dual_x or Dual_x_array: The sum, whose dual part is the sum of the dual parts.
+    """
+    r, d = _parts(x)
+    return _wrap(np.sum(r, axis=axis), None if d is None else np.sum(d, axis=axis))
+
+
+def mean(x, axis=None):
+    """Average the elements of a dual array.
+
+    Args:
+        x (Dual_x or Dual_x_array): The dual array to reduce.
+        axis (int or tuple of int, optional): Axis or axes along which to average. Averages all elements by default.
+
+    Returns:
+        Dual_x or Dual_x_array: The mean, whose dual part is the mean of the dual parts.
+    """
+    r, d = _parts(x)
+    return _wrap(np.mean(r, axis=axis), None if d is None else np.mean(d, axis=axis))
+
+
+def dot(a, b):
+    r"""Compute the dot product of two dual arrays.
+
+    Follows the semantics of ``numpy.dot``. Either argument may be a plain array, in which case it is treated
+    as a constant.
+
+    Args:
+        a (Dual_x, Dual_x_array, or array-like): The left operand.
+        b (Dual_x, Dual_x_array, or array-like): The right operand.
+
+    Returns:
+        Dual_x or Dual_x_array: The product :math:`a \cdot b + (a \cdot db + da \cdot b)\epsilon`.
+    """
+    ar, ad = _parts(a)
+    br, bd = _parts(b)
+    return _product(np.dot, ar, ad, br, bd)
+
+
+def matmul(a, b):
+    r"""Multiply two dual matrices.
+
+    Follows the semantics of ``numpy.matmul``, including broadcasting over leading batch dimensions. The
+    dual part :math:`A\,dB + dA\,B` is evaluated as two GEMMs.
+
+    Args:
+        a (Dual_x, Dual_x_array, or array-like): The left operand.
+        b (Dual_x, Dual_x_array, or array-like): The right operand.
+
+    Returns:
+        Dual_x or Dual_x_array: The matrix product.
+    """
+    ar, ad = _parts(a)
+    br, bd = _parts(b)
+    return _product(np.matmul, ar, ad, br, bd)
+
+
+def outer(a, b):
+    """Compute the outer product of two dual vectors.
+
+    Args:
+        a (Dual_x, Dual_x_array, or array-like): The left vector. Flattened if not already 1D.
+        b (Dual_x, Dual_x_array, or array-like): The right vector. Flattened if not already 1D.
+
+    Returns:
+        Dual_x: A dual matrix of shape ``(a.size, b.size)``.
+    """
+    ar, ad = _parts(a)
+    br, bd = _parts(b)
+    return _product(np.outer, ar, ad, br, bd)
+
+
+def norm(x, axis=None):
+    r"""Compute the Euclidean (or Frobenius) norm of a dual array.
+
+    The dual part is :math:`(x \cdot dx) / \|x\|`.
+
+    Args:
+        x (Dual_x or Dual_x_array): The dual array.
+        axis (int, optional): Axis along which to take vector norms. Uses all elements by default.
+
+    Returns:
+        Dual_x or Dual_x_array: The norm.
+
+    Raises:
+        ValueError: If any norm is zero, where the derivative is undefined.
+    """
+    r, d = _parts(x)
+    if axis is None:
+        n = np.sqrt(np.vdot(r, r))  # Single BLAS call over the flattened array
+    else:
+        n = np.sqrt(np.sum(r * r, axis=axis))
+    if d is None:
+        return _wrap(n, None)
+    if np.any(n == 0):
+        raise ValueError("Norm derivative undefined at the zero vector.")
+    if axis is None:
+        return _wrap(n, np.vdot(r, d) / n)
+    return _wrap(n, np.sum(r * d, axis=axis) / n)
+
+
+cdef tuple _solve_batch(Ar, Ad, br, bd, factor, backsolve):
+    r"""Solve a (possibly batched) dual linear system with one factorization per matrix.
+
+    `factor` maps a real matrix to its factors and `backsolve(factors, rhs)` solves against them. The
+    tangent system :math:`A\,dx = db - dA\,x` reuses the factors computed for the real solve.
+    """
+    if Ar.ndim == 2:
+        factors = factor(Ar)
+        x = backsolve(factors, br)
+        if Ad is None and bd is None:
+            return x, None
+        rhs = np.zeros_like(x) if bd is None else np.array(bd, dtype=np.float64)
+        if Ad is not None:
+            rhs -= Ad @ x
+        return x, backsolve(factors, rhs)
+
+    if Ar.ndim != 3:
+        raise ValueError(f"Expected a matrix or a batch of matrices, got shape {Ar.shape}")
+    xs = []
+    dxs = []
+    for i in range(Ar.shape[0]):
+        x, dx = _solve_batch(
+            Ar[i], None if Ad is None else Ad[i], br[i], None if bd is None else bd[i], factor, backsolve
+        )
+        xs.append(x)
+        dxs.append(dx)
+    if dxs[0] is None:
+        return np.stack(xs), None
+    return np.stack(xs), np.stack(dxs)
+
+
+def solve(A, b):
+    r"""Solve the dual linear system :math:`A x = b`.
+
+    The real part of `A` is LU-factored once and the factors are reused for the tangent solve
+    :math:`dx = A^{-1}(db - dA\,x)`, so the cost is about one factorization.
+
+    Args:
+        A (Dual_x or array-like): A square matrix of shape ``(n, n)``, or a batch of shape ``(B, n, n)``.
+        b (Dual_x, Dual_x_array, or array-like): Right-hand side of shape ``(n,)`` or ``(n, k)``, with a
+            leading batch dimension if `A` is batched.
+
+    Returns:
+        Dual_x or Dual_x_array: The solution `x`.
+
+    Raises:
+        ValueError: If `A` is not a matrix or a batch of matrices.
+        numpy.linalg.LinAlgError: If the real part of `A` (or of any matrix in the batch) is singular.
+    """
+    from scipy.linalg import lu_factor, lu_solve, LinAlgWarning
+
+    def factor(M):
+        # scipy only warns about a zero pivot; raise instead of back-solving into infs and NaNs
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', LinAlgWarning)
+            lu, piv = lu_factor(M)
+        if np.any(np.diagonal(lu) == 0):
+            raise np.linalg.LinAlgError("Singular matrix: the real part of A has a zero pivot.")
+        return lu, piv
+
+    Ar, Ad = _parts(A)
+    br, bd = _parts(b)
+    x, dx = _solve_batch(Ar, Ad, br, bd, factor, lu_solve)
+    return _wrap(x, dx)
+
+
+def cholesky_solve(A, b):
+    r"""Solve the dual linear system :math:`A x = b` for a symmetric positive definite `A`.
+
+    Identical to :func:`solve`, but factors the real part of `A` with a single Cholesky decomposition.
+
+    Args:
+        A (Dual_x or array-like): A symmetric positive definite matrix of shape ``(n, n)``, or a batch of
+            shape ``(B, n, n)``.
+        b (Dual_x, Dual_x_array, or array-like): Right-hand side of shape ``(n,)`` or ``(n, k)``, with a
+            leading batch dimension if `A` is batched.
+
+    Returns:
+        Dual_x or Dual_x_array: The solution `x`.
+
+    Raises:
+        numpy.linalg.LinAlgError: If the real part of `A` is not positive definite.
+    """
+    from scipy.linalg import cho_factor, cho_solve
+
+    Ar, Ad = _parts(A)
+    br, bd = _parts(b)
+    x, dx = _solve_batch(Ar, Ad, br, bd, cho_factor, cho_solve)
+    return _wrap(x, dx)
+
+
+def lstsq(A, b):
+    r"""Solve the dual least-squares problem :math:`\min_x \|A x - b\|`.
+
+    The real part of `A` is QR-factored once. Since :math:`A^T A = R^T R`, the tangent of the normal
+    equations, :math:`A^T A\,dx = dA^T (b - A x) + A^T (db - dA\,x)`, is solved with two triangular solves
+    against the same `R`.
+
+    Args:
+        A (Dual_x or array-like): A matrix of shape ``(m, n)`` with full column rank, or a batch of shape
+            ``(B, m, n)``.
+        b (Dual_x, Dual_x_array, or array-like): Right-hand side of shape ``(m,)`` or ``(m, k)``, with a
+            leading batch dimension if `A` is batched.
+
+    Returns:
+        Dual_x or Dual_x_array: The least-squares solution `x`.
+    """
+    from scipy.linalg import qr, solve_triangular
+
+    Ar, Ad = _parts(A)
+    br, bd = _parts(b)
+
+    def one(Ar, Ad, br, bd):
+        Q, R = qr(Ar, mode='economic')
+        x = solve_triangular(R, Q.T @ br)
+        if Ad is None and bd is None:
+            return x, None
+        rhs = np.zeros_like(x)
+        if bd is not None:
+            rhs += Ar.T @ bd
+        if Ad is not None:
+            rhs += Ad.T @ (br - Ar @ x) - Ar.T @ (Ad @ x)
+        y = solve_triangular(R, rhs, trans='T')
+        return x, solve_triangular(R, y)
+
+    if Ar.ndim == 2:
+        x, dx = one(Ar, Ad, br, bd)
+    else:
+        x, dx = zip(*[
+            one(Ar[i], None if Ad is None else Ad[i], br[i], None if bd is None else bd[i])
+            for i in range(Ar.shape[0])
+        ])
+        x = np.stack(x)
+        dx = None if dx[0] is None else np.stack(dx)
+    return _wrap(x, dx)
@@ -0,0 +1,221 @@
+from libc.math cimport sqrt, pow, fabs
+import numpy as np
+from dual_autodiff_x.dual import _parts, _wrap
+
+__all__ = ['rk4', 'rk45']
+
+# Dormand-Prince 5(4) tableau
+_DP_C = (0.0, 1.0 / 5, 3.0 / 10, 4.0 / 5, 8.0 / 9, 1.0, 1.0)
+_DP_A = (
+    (),
+    (1.0 / 5,),
+    (3.0 / 40, 9.0 / 40),
+    (44.0 / 45, -56.0 / 15, 32.0 / 9),
+    (19372.0 / 6561, -25360.0 / 2187, 64448.0 / 6561, -212.0 / 729),
+    (9017.0 / 3168, -355.0 / 33, 46732.0 / 5247, 49.0 / 176, -5103.0 / 18656),
+    (35.0 / 384, 0.0, 500.0 / 1113, 125.0 / 192, -2187.0 / 6784, 11.0 / 84),
+)
+# Difference between the 5th and 4th order weights, used for the error estimate
+_DP_E = (
+    71.0 / 57600, 0.0, -71.0 / 16695, 71.0 / 1920, -17253.0 / 339200, 22.0 / 525, -1.0 / 40
+)
+
+
+cdef class _Buffer:
+    """A preallocated real/dual pair together with the dual object that views it.
+
+    The view is handed to the right-hand side function, so stage states never need a new allocation.
+    """
+    cdef public object real
+    cdef public object dual
+    cdef public object view
+
+    def __cinit__(self, shape):
+        self.real = np.zeros(shape, dtype=np.float64)
+        self.dual = np.zeros(shape, dtype=np.float64)
+        self.view = _wrap(self.real, self.dual)
+
+    cdef void assign(self, value):
+        """Copy the output of the right-hand side into this buffer."""
+        r, d = _parts(value)
+        self.real[...] = r
+        if d is None:
+            self.dual.fill(0.0)
+        else:
+            self.dual[...] = d
+
+    cdef void combine(self, _Buffer y, double h, tuple coeffs, list k, _Buffer scratch):
+        """Set this buffer to ``y + h * sum(coeffs[i] * k[i])`` using only in-place operations."""
+        cdef _Buffer ki
+        np.copyto(self.real, y.real)
+        np.copyto(self.dual, y.dual)
+        for i in range(len(coeffs)):
+            if coeffs[i] == 0.0:
+                continue
+            ki = k[i]
+            np.multiply(ki.real, h * coeffs[i], out=scratch.real)
+            np.multiply(ki.dual, h * coeffs[i], out=scratch.dual)
+            self.real += scratch.real
+            self.dual += scratch.dual
+
+
+cdef tuple _setup(y0, t):
+    """Validate the inputs and allocate the state and output arrays."""
+    t = np.asarray(t, dtype=np.float64)
+    if t.ndim != 1 or t.shape[0] < 2:
+        raise ValueError("t must be a 1D array of at least two output times.")
+    if np.any(np.diff(t) <= 0):
+        raise ValueError("t must be strictly increasing.")
+    r0, d0 = _parts(y0)
+    r0 = np.atleast_1d(r0)
+    y = _Buffer(r0.shape)
+    y.real[...] = r0
+    if d0 is not None:
+        y.dual[...] = np.atleast_1d(d0)
+    out_r = np.empty((t.shape[0],) + r0.shape, dtype=np.float64)
+    out_d = np.empty((t.shape[0],) + r0.shape, dtype=np.float64)
+    out_r[0] = y.real
+    out_d[0] = y.dual
+    return t, y, out_r, out_d
+
+
+def rk4(f, y0, t, args=(), int substeps=1):
+    """Integrate a batch of dual ODEs with the classical fixed-step Runge-Kutta method.
+
+    The state is a dual array, so the dual part of the trajectory is the forward sensitivity with
+    respect to whatever was seeded in `y0` or in dual parameters passed through `args`. All stage buffers
+    are allocated once; each step only allocates whatever `f` itself returns.
+
+    Args:
+        f (callable): The right-hand side ``f(t, y, *args)``. Receives `y` as a Dual_x_array for a 1D state
+            (e.g. a batch of scalar ODEs) or as a Dual_x otherwise, and returns a dual value of the same shape.
+        y0 (Dual_x, Dual_x_array, or array-like): The initial state. A leading axis may index trajectories.
+        t (array-like): Strictly increasing output times. The first entry is the initial time.
+        args (tuple, optional): Extra arguments passed to `f`, such as dual parameters.
+        substeps (int, optional): Number of equal RK4 steps taken between consecutive output times.
+
+    Returns:
+        Dual_x: The trajectory, of shape ``(len(t),) + y0.shape``.
+
+    Raises:
+        ValueError: If `t` is not strictly increasing or `substeps` is less than 1.
+    """
+    if substeps < 1:
+        raise ValueError("substeps must be at least 1.")
+    t, y, out_r, out_d = _setup(y0, t)
+    shape = y.real.shape
+    k = [_Buffer(shape) for _ in range(4)]
+    cdef _Buffer stage = _Buffer(shape)
+    cdef _Buffer scratch = _Buffer(shape)
+    cdef _Buffer k1 = k[0], k2 = k[1], k3 = k[2], k4 = k[3]
+    cdef double tn, h
+    cdef Py_ssize_t i, j
+
+    for i in range(1, t.shape[0]):
+        h = (t[i] - t[i - 1]) / substeps
+        for j in range(substeps):
+            tn = t[i - 1] + j * h
+            k1.assign(f(tn, y.view, *args))
+            stage.combine(y, h, (0.5,), k, scratch)
+            k2.assign(f(tn + 0.5 * h, stage.view, *args))
+            stage.combine(y, h, (0.0, 0.5), k, scratch)
+            k3.assign(f(tn + 0.5 * h, stage.view, *args))
+            stage.combine(y, h, (0.0, 0.0, 1.0), k, scratch)
+            k4.assign(f(tn + h, stage.view, *args))
+            stage.combine(y, h, (1.0 / 6, 1.0 / 3, 1.0 / 3, 1.0 / 6), k, scratch)
+            np.copyto(y.real, stage.real)
+            np.copyto(y.dual, stage.dual)
+        out_r[i] = y.real
+        out_d[i] = y.dual
+    return _wrap(out_r, out_d)
+
+
+def rk45(f, y0, t, args=(), double rtol=1e-6, double atol=1e-9, first_step=None, int max_steps=100000):
+    """Integrate a batch of dual ODEs with the adaptive Dormand-Prince 5(4) method.
+
+    All trajectories in the batch share one step size, chosen so that the trajectory with the largest RMS
+    error (taken over its non-batch axes) meets the tolerance.
+    The error is measured on the real part only, so the sensitivities follow the steps chosen for the
+    solution itself. Steps are shortened to land exactly on each output time. As in :func:`rk4`, the seven
+    stage buffers are allocated once.
+
+    Args:
+        f (callable): The right-hand side ``f(t, y, *args)``, as in :func:`rk4`.
+        y0 (Dual_x, Dual_x_array, or array-like): The initial state. A leading axis may index trajectories.
+        t (array-like): Strictly increasing output times. The first entry is the initial time.
+        args (tuple, optional): Extra arguments passed to `f`, such as dual parameters.
+        rtol (float, optional): Relative tolerance.
+        atol (float, optional): Absolute tolerance.
+        first_step (float, optional): Initial step size. Defaults to 1% of the first output interval.
+        max_steps (int, optional): Maximum number of attempted steps before giving up.
+
+    Returns:
+        Dual_x: The trajectory, of shape ``(len(t),) + y0.shape``.
+
+    Raises:
+        ValueError: If `t` is not strictly increasing.
+        RuntimeError: If `max_steps` is exceeded or the step size underflows.
+    """
+    t, y, out_r, out_d = _setup(y0, t)
+    shape = y.real.shape
+    k = [_Buffer(shape) for _ in range(7)]
+    cdef _Buffer stage = _Buffer(shape)
+    cdef _Buffer y_new = _Buffer(shape)
+    cdef _Buffer scratch = _Buffer(shape)
+    cdef _Buffer ki
+    err = np.empty(shape, dtype=np.float64)
+    # Squared errors with the trajectory (leading) axis kept and all other axes flattened
+    err_per_trajectory = err.reshape(shape[0], -1)
+    rms = np.empty(shape[0], dtype=np.float64)
+    cdef double tn = t[0]
+    cdef double h = 0.01 * (t[1] - t[0]) if first_step is None else first_step
+    cdef double h_step, err_norm, factor
+    cdef Py_ssize_t i, s
+    cdef int steps = 0
+    cdef bint landing
+
+    (<_Buffer> k[0]).assign(f(tn, y.view, *args))
+    for i in range(1, t.shape[0]):
+        while tn < t[i]:
+            steps += 1
+            if steps > max_steps:
+                raise RuntimeError(f"Maximum number of steps ({max_steps}) exceeded.")
+            landing = h >= t[i] - tn
+            h_step = t[i] - tn if landing else h
+            if h_step <= 1e-14 * max(fabs(tn), 1.0):
+                raise RuntimeError(f"Step size underflow at t={tn}.")
+
+            for s in range(1, 6):
+                stage.combine(y, h_step, _DP_A[s], k, scratch)
+                (<_Buffer> k[s]).assign(f(tn + _DP_C[s] * h_step, stage.view, *args))
+            y_new.combine(y, h_step, _DP_A[6], k, scratch)
+            (<_Buffer> k[6]).assign(f(tn + h_step, y_new.view, *args))
+
+            # Scaled RMS error of the real part, computed in preallocated buffers
+            err.fill(0.0)
+            for s in range(7):
+                ki = k[s]
+                np.multiply(ki.real, h_step * _DP_E[s], out=scratch.real)
+                err += scratch.real
+            np.abs(y.real, out=scratch.real)
+            np.abs(y_new.real, out=scratch.dual)
+            np.maximum(scratch.real, scratch.dual, out=scratch.real)
+            scratch.real *= rtol
+            scratch.real += atol
+            np.divide(err, scratch.real, out=err)
+            np.square(err, out=err)
+            np.mean(err_per_trajectory, axis=1, out=rms)
+            err_norm = sqrt(rms.max())  # Worst trajectory, so hard members are not averaged away
+
+            if err_norm <= 1.0:
+                tn = t[i] if landing else tn + h_step
+                np.copyto(y.real, y_new.real)
+                np.copyto(y.dual, y_new.dual)
+                k[0], k[6] = k[6], k[0]  # First same as last
+                factor = 10.0 if err_norm == 0.0 else min(10.0, 0.9 * pow(err_norm, -0.2))
+            else:
+                factor = max(0.2, 0.9 * pow(err_norm, -0.2))
+            h = h_step * factor
+        out_r[i] = y.real
+        out_d[i] = y.dual
+    return _wrap(out_r, out_d)
@@ -0,0 +1,309 @@
+from collections import OrderedDict
+from libc.math cimport sqrt
+import numpy as np
+from dual_autodiff_x.dual import Dual_x, Dual_x_array, _parts
+
+__all__ = ['DualObjective', 'minimize', 'fixed_point', 'root']
+
+
+cdef class DualObjective:
+    r"""Adapter exposing a dual-number function to ``scipy.optimize``.
+
+    The value and gradient of `f` are computed together and stored in a small LRU cache keyed by the
+    bytes of the input, so `fun` and `jac` requested at the same point (as line searches often do) share
+    one evaluation.
+
+    The cache removes repeated evaluations at the same point, not the cost of forward mode itself. In the
+    default mode `f` is called once per input direction with a Dual_x_array seeded with that unit
+    direction, so every new point costs ``n`` evaluations of `f`. Only ``vectorized=True`` gets the
+    gradient from a single call. `f` then receives a Dual_x of shape ``(n, n)`` whose column :math:`j`
+    holds the input with direction :math:`e_j` in its dual part, and it must reduce over axis 0 and
+    return a dual array of shape ``(n,)``.
+
+    Attributes:
+        hits (int): Number of requests answered from the cache.
+        misses (int): Number of requests that evaluated `f`.
+
+    Example:
+        >>> objective = DualObjective(f)
+        >>> scipy.optimize.minimize(objective.fun, x0, jac=objective.jac, hessp=objective.hessp)
+    """
+    cdef object f
+    cdef object cache
+    cdef Py_ssize_t cache_size
+    cdef bint vectorized
+    cdef public Py_ssize_t hits
+    cdef public Py_ssize_t misses
+
+    def __cinit__(self, f, Py_ssize_t cache_size=8, bint vectorized=False):
+        """Initialize the adapter.
+
+        Args:
+            f (callable): The scalar objective, written in terms of dual numbers.
+            cache_size (int, optional): Number of evaluated points kept in the cache.
+            vectorized (bool, optional): Whether `f` accepts all directions in a single call.
+
+        Raises:
+            ValueError: If `cache_size` is less than 1.
+        """
+        if cache_size < 1:
+            raise ValueError("cache_size must be at least 1.")
+        self.f = f
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        self.vectorized = vectorized
+        self.hits = 0
+        self.misses = 0
+
+    cdef tuple _evaluate(self, x):
+        """Return the cached ``(value, gradient)`` pair at `x`, evaluating `f` on a miss."""
+        x = np.ascontiguousarray(x, dtype=np.float64)
+        key = x.tobytes()
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return cached
+
+        self.misses += 1
+        cdef Py_ssize_t n = x.shape[0]
+        cdef Py_ssize_t i
+        grad = np.empty(n, dtype=np.float64)
+        if self.vectorized:
+            r, d = _parts(self.f(Dual_x(np.repeat(x[:, None], n, axis=1), np.eye(n))))
+            value = float(np.ravel(r)[0])
+            grad[:] = d
+        else:
+            seed = np.zeros(n, dtype=np.float64)
+            value = 0.0
+            for i in range(n):
+                seed[i] = 1.0
+                r, d = _parts(self.f(Dual_x_array(x.copy(), seed.copy())))
+                seed[i] = 0.0
+                value = float(r)
+                grad[i] = d
+
+        result = (value, grad)
+        self.cache[key] = result
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return result
+
+    def fun(self, x):
+        """Evaluate the objective at `x`."""
+        return self._evaluate(x)[0]
+
+    def jac(self, x):
+        """Evaluate the gradient at `x`."""
+        return self._evaluate(x)[1].copy()  # Callers may modify the gradient in place
+
+    def value_and_grad(self, x):
+        """Evaluate the objective and its gradient at `x`, for use with ``jac=True``."""
+        value, grad = self._evaluate(x)
+        return value, grad.copy()
+
+    def hessp(self, x, p):
+        r"""Approximate the Hessian-vector product at `x` along `p`.
+
+        Dual numbers only carry first derivatives, so this is the forward difference of the exact gradient,
+        :math:`(\nabla f(x + h p) - \nabla f(x)) / h`. The gradient at `x` is normally already cached.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        p = np.asarray(p, dtype=np.float64)
+        cdef double p_norm = sqrt(np.dot(p, p))
+        if p_norm == 0.0:
+            return np.zeros_like(x)
+        cdef double h = 1.4901161193847656e-08 * (1.0 + sqrt(np.dot(x, x))) / p_norm
+        return (self._evaluate(x + h * p)[1] - self._evaluate(x)[1]) / h
+
+    def cache_info(self):
+        """Return the cache statistics.
+
+        Returns:
+            dict: The ``hits``, ``misses``, current ``size`` and ``max_size`` of the cache.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self.cache),
+            'max_size': self.cache_size,
+        }
+
+    def cache_clear(self):
+        """Empty the cache and reset the counters."""
+        self.cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def minimize(f, x0, method='L-BFGS-B', cache_size=8, vectorized=False, **kwargs):
+    """Minimize a dual-number function with ``scipy.optimize.minimize``.
+
+    Wraps `f` in a :class:`DualObjective` and passes its `fun`, `jac` and, for methods that use it,
+    `hessp`. A `jac` or `hessp` given in `kwargs` takes precedence over the adapter's. As with
+    :class:`DualObjective`, each gradient at a new point costs ``n`` evaluations of `f` unless
+    `vectorized` is set.
+
+    Args:
+        f (callable): The scalar objective, written in terms of dual numbers.
+        x0 (array-like): The initial guess.
+        method (str, optional): The SciPy method.
+        cache_size (int, optional): Number of evaluated points kept in the cache.
+        vectorized (bool, optional): Whether `f` accepts all directions in a single call.
+        **kwargs: Passed on to ``scipy.optimize.minimize``.
+
+    Returns:
+        scipy.optimize.OptimizeResult: The result, with the cache statistics added as ``cache_info``.
+    """
+    from scipy.optimize import minimize as scipy_minimize
+
+    objective = DualObjective(f, cache_size=cache_size, vectorized=vectorized)
+    if method in ('Newton-CG', 'trust-ncg', 'trust-krylov', 'trust-constr'):
+        kwargs.setdefault('hessp', objective.hessp)
+    kwargs.setdefault('jac', objective.jac)
+    result = scipy_minimize(objective.fun, x0, method=method, **kwargs)
+    result.cache_info = objective.cache_info()
+    return result
+
+
+cdef tuple _split_args(args, Py_ssize_t n):
+    """Return the arguments with their dual parts removed, with their dual parts zeroed, and as given.
+
+    The first form is passed to plain-float iterations, the second to dual evaluations that should only
+    carry a derivative with respect to `x`, and the third to the final evaluation along the directions of
+    `args`. Scalar and 1D Dual_x arguments are broadcast to length-`n` Dual_x_array objects in the last two
+    forms, so they combine with the Dual_x_array `x`.
+    """
+    plain = []
+    frozen = []
+    dual = []
+    for a in args:
+        if isinstance(a, Dual_x) and np.ndim(a.real) <= 1:
+            a = Dual_x_array(
+                np.ascontiguousarray(np.broadcast_to(a.real, (n,)), dtype=np.float64),
+                np.ascontiguousarray(np.broadcast_to(a.dual, (n,)), dtype=np.float64)
+            )
+        if isinstance(a, Dual_x_array):
+            plain.append(a.real)
+            frozen.append(Dual_x_array(a.real, np.zeros_like(a.real)))
+        elif isinstance(a, Dual_x):
+            plain.append(a.real)
+            frozen.append(Dual_x(a.real, np.zeros_like(a.real)))
+        else:
+            plain.append(a)
+            frozen.append(a)
+        dual.append(a)
+    return tuple(plain), tuple(frozen), tuple(dual)
+
+
+cdef object _implicit_result(f, x, args, dfdx, bint scalar):
+    r"""Differentiate the solution `x` of :math:`F(x, \theta) = 0` with respect to the dual parts of `args`.
+
+    A single dual evaluation at the solution gives :math:`\partial F/\partial\theta \cdot d\theta`, and the
+    implicit function theorem gives :math:`dx = -(\partial F/\partial\theta \cdot d\theta) / (\partial F/\partial x)`.
+    """
+    if np.any(dfdx == 0):
+        raise ValueError("Residual derivative is zero at the solution; the implicit derivative is undefined.")
+    r, d = _parts(f(Dual_x_array(x, np.zeros_like(x)), *args))
+    dual = np.zeros_like(x) if d is None else -d / dfdx
+    if scalar:
+        return Dual_x(float(x[0]), float(dual[0]))
+    return Dual_x_array(x, np.ascontiguousarray(dual, dtype=np.float64))
+
+
+def fixed_point(g, x0, args=(), g_real=None, double tol=1e-12, int max_iter=500):
+    r"""Solve a batch of scalar fixed-point problems :math:`x = g(x, \theta)` and differentiate the solution.
+
+    The iterations run with the dual parts of `args` zeroed, or on plain floats if `g_real` is given.
+    Once converged, the derivative of each solution with respect to the dual parts of `args` follows from
+    the implicit function theorem, :math:`dx = g_\theta\,d\theta / (1 - g_x)`, which costs two dual
+    evaluations of `g` (one for :math:`g_x`, one for :math:`g_\theta\,d\theta`) regardless of the number
+    of iterations.
+
+    Args:
+        g (callable): The map ``g(x, *args)``, applied element-wise over the batch. It is called with a
+            Dual_x_array `x` and the dual `args` for the derivatives.
+        x0 (float or array-like): The initial guess, one entry per problem.
+        args (tuple, optional): Extra arguments, typically Dual_x or Dual_x_array parameters whose dual parts
+            are the directions to differentiate along. Scalar Dual_x parameters apply to every problem.
+        g_real (callable, optional): A plain-float version of `g` used for the iterations, called with NumPy
+            arrays in place of `x` and the dual arguments. By default the iterations call `g` itself with
+            zero dual parts and keep the real part of the result.
+        tol (float, optional): Relative tolerance on the change between iterations.
+        max_iter (int, optional): Maximum number of iterations.
+
+    Returns:
+        Dual_x or Dual_x_array: The fixed points, with their derivatives in the dual part. A scalar `x0`
+        gives a Dual_x.
+
+    Raises:
+        RuntimeError: If the iteration does not converge within `max_iter` iterations.
+        ValueError: If :math:`g_x = 1` at a solution.
+    """
+    cdef bint scalar = np.ndim(x0) == 0
+    x = np.atleast_1d(np.asarray(x0, dtype=np.float64)).copy()
+    plain, frozen, dual = _split_args(args, x.shape[0])
+    zeros = np.zeros_like(x)
+    cdef int i
+    for i in range(max_iter):
+        if g_real is None:
+            x_new = np.asarray(_parts(g(Dual_x_array(x, zeros), *frozen))[0], dtype=np.float64)
+        else:
+            x_new = np.asarray(g_real(x, *plain), dtype=np.float64)
+        converged = np.all(np.abs(x_new - x) <= tol * (1.0 + np.abs(x_new)))
+        x = x_new
+        if converged:
+            break
+    else:
+        raise RuntimeError(f"Fixed-point iteration did not converge in {max_iter} iterations.")
+
+    residual = lambda y, *a: g(y, *a) - y
+    _, gx = _parts(g(Dual_x_array(x, np.ones_like(x)), *frozen))
+    return _implicit_result(residual, x, dual, gx - 1.0, scalar)
+
+
+def root(f, x0, args=(), double tol=1e-12, int max_iter=100):
+    r"""Solve a batch of scalar equations :math:`f(x, \theta) = 0` and differentiate the solution.
+
+    Newton's method runs with the dual parts of `args` zeroed, so each step carries only the derivative
+    with respect to `x` that the step itself needs, and no tangent error accumulates. At convergence the
+    derivative with respect to the dual parts of `args` costs one more dual evaluation of `f`, via
+    :math:`dx = -f_\theta\,d\theta / f_x`.
+
+    Args:
+        f (callable): The residual ``f(x, *args)``, applied element-wise over the batch. It is called with
+            a Dual_x_array `x`.
+        x0 (float or array-like): The initial guess, one entry per problem.
+        args (tuple, optional): Extra arguments, typically Dual_x or Dual_x_array parameters whose dual parts
+            are the directions to differentiate along. Scalar Dual_x parameters apply to every problem.
+        tol (float, optional): Absolute tolerance on the residual, or relative tolerance on the last Newton
+            step, whichever is met first for each problem.
+        max_iter (int, optional): Maximum number of Newton iterations.
+
+    Returns:
+        Dual_x or Dual_x_array: The roots, with their derivatives in the dual part. A scalar `x0` gives a
+        Dual_x.
+
+    Raises:
+        RuntimeError: If Newton's method does not converge within `max_iter` iterations.
+        ValueError: If :math:`f_x = 0` at an iterate.
+    """
+    cdef bint scalar = np.ndim(x0) == 0
+    x = np.atleast_1d(np.asarray(x0, dtype=np.float64)).copy()
+    ones = np.ones_like(x)
+    step = np.full_like(x, np.inf)
+    _, frozen, dual = _split_args(args, x.shape[0])
+    cdef int i
+    for i in range(max_iter):
+        r, fx = _parts(f(Dual_x_array(x, ones), *frozen))
+        # A residual at the rounding level of a large root may never reach tol, but the step still vanishes
+        if np.all((np.abs(r) <= tol) | (np.abs(step) <= tol * (1.0 + np.abs(x)))):
+            break
+        if np.any(fx == 0):
+            raise ValueError("Residual derivative is zero; Newton's method cannot continue.")
+        step = r / fx
+        x = x - step
+    else:
+        raise RuntimeError(f"Newton's method did not converge in {max_iter} iterations.")
+
+    return _implicit_result(f, x, dual, fx, scalar)
@@ -0,0 +1,82 @@
+import pytest
+import numpy as np
+from dual_autodiff_x.dual import Dual_x
+from dual_autodiff_x.dual import Dual_x_array
+from dual_autodiff_x import control
+
+# Tests for comparisons and branch-free selection
+
+
+def test_compare():
+    # Test comparisons act on the real part only
+    test_number1 = Dual_x_array(np.array([1.0, 2.0, 3.0]), np.array([9.0, 9.0, 9.0]))
+    test_number2 = Dual_x_array(np.array([3.0, 2.0, 1.0]), np.array([0.0, 0.0, 0.0]))
+    assert np.all((test_number1 < test_number2) == np.array([True, False, False]))
+    assert np.all((test_number1 <= test_number2) == np.array([True, True, False]))
+    assert np.all((test_number1 > 2.0) == np.array([False, False, True]))
+    assert np.all((test_number1 >= 2.0) == np.array([False, True, True]))
+    assert Dual_x(1.0, 5.0) < Dual_x(2.0, 0.0)
+
+def test_abs():
+    # Test absolute value flips the dual part of negative elements
+    test_number = Dual_x_array(np.array([-2.0, 0.0, 3.0]), np.array([1.0, 1.0, 1.0]))
+    abs_test = abs(test_number)
+    assert np.all(abs_test.real == np.array([2.0, 0.0, 3.0]))
+    assert np.all(abs_test.dual == np.array([-1.0, 1.0, 1.0]))
+
+    abs_scalar = abs(Dual_x(-2.0, 1.0))
+    assert abs_scalar.real == 2.0
+    assert abs_scalar.dual == -1.0
+
+def test_where():
+    # Test where takes the dual part of the selected branch
+    x = Dual_x_array(np.array([1.0, 2.0]), np.array([3.0, 4.0]))
+    y = Dual_x_array(np.array([5.0, 6.0]), np.array([7.0, 8.0]))
+    selected = control.where(np.array([True, False]), x, y)
+    assert isinstance(selected, Dual_x_array)
+    assert np.all(selected.real == np.array([1.0, 6.0]))
+    assert np.all(selected.dual == np.array([3.0, 8.0]))
+
+    # Plain arrays contribute a zero dual part
+    selected = control.where(x > 1.5, x, 0.0)
+    assert np.all(selected.real == np.array([0.0, 2.0]))
+    assert np.all(selected.dual == np.array([0.0, 4.0]))
+
+def test_maximum_minimum():
+    # Test maximum and minimum select on the real part
+    x = Dual_x_array(np.array([1.0, 6.0]), np.array([3.0, 4.0]))
+    y = Dual_x_array(np.array([5.0, 2.0]), np.array([7.0, 8.0]))
+    biggest = control.maximum(x, y)
+    smallest = control.minimum(x, y)
+    assert np.all(biggest.real == np.array([5.0, 6.0]))
+    assert np.all(biggest.dual == np.array([7.0, 4.0]))
+    assert np.all(smallest.real == np.array([1.0, 2.0]))
+    assert np.all(smallest.dual == np.array([3.0, 8.0]))
+
+def test_clip():
+    # Test clipped elements have zero derivative
+    x = Dual_x_array(np.array([-1.0, 0.5, 2.0]), np.array([1.0, 1.0, 1.0]))
+    clipped = control.clip(x, 0.0, 1.0)
+    assert np.all(clipped.real == np.array([0.0, 0.5, 1.0]))
+    assert np.all(clipped.dual == np.array([0.0, 1.0, 0.0]))
+
+def test_piecewise():
+    # Test each branch is evaluated only on its own elements, so log never sees negative inputs
+    x = Dual_x_array(np.array([-2.0, 1.0, 2.0]), np.array([1.0, 1.0, 1.0]))
+    result = control.piecewise(x, [x <= 0], [lambda v: v * v, lambda v: v.log()])
+    assert result.real == pytest.approx(np.array([4.0, 0.0, np.log(2.0)]))
+    assert result.dual == pytest.approx(np.array([-4.0, 1.0, 0.5]))
+
+    # Test constant branches and the length check
+    result = control.piecewise(x, [x < 0, x > 1.5], [0.0, lambda v: v])
+    assert np.all(result.real == np.array([0.0, 0.0, 2.0]))
+    assert np.all(result.dual == np.array([0.0, 0.0, 1.0]))
+    with pytest.raises(ValueError, match="Expected 1 or 2 functions"):
+        control.piecewise(x, [x < 0], [0.0, 1.0, 2.0])
+
+def test_hashable():
+    # Test comparison operators do not make the classes unhashable
+    scalar = Dual_x(1.0, 2.0)
+    array = Dual_x_array(np.array([1.0]), np.array([2.0]))
+    assert scalar in {scalar}
+    assert array in {array}
@@ -301,6 +301,19 @@ def test_mul_array_adapt():
     assert np.all(test_prod.real == expected_real)
     assert np.all(test_prod.dual == expected_dual)
 
+def test_broadcast_array_adapt():
+    # Test a length-1 Dual_x_array broadcasts against a longer one, on either side
+    one = Dual_x_array(np.array([2.0]), np.array([1.0]))
+    many = Dual_x_array(np.arange(3.0), np.ones(3))
+    assert np.all((one + many).real == np.array([2.0, 3.0, 4.0]))
+    assert np.all((one + many).dual == np.array([2.0, 2.0, 2.0]))
+    assert np.all((many - one).real == np.array([-2.0, -1.0, 0.0]))
+    assert np.all((many - one).dual == np.array([0.0, 0.0, 0.0]))
+    assert np.all((many * one).real == np.array([0.0, 2.0, 4.0]))
+    assert np.all((one * many).dual == np.array([2.0, 3.0, 4.0]))
+    with pytest.raises(ValueError):
+        many + Dual_x_array(np.ones(2), np.ones(2))
+
 def test_pow_array_adapt():
     # Test element-wise power operation for Dual_x_array
     test_number = Dual_x_array(np.array([2.0, 3.0]), np.array([1.0, 1.0]))
@@ -396,3 +409,172 @@ def test_shape_mismatch_exception_adapt():
     dual = np.array([4.0, 5.0])  # Mismatched shape
     with pytest.raises(ValueError, match="Shape mismatch"):
         Dual_x_array(real, dual)
+
+def test_len_adapt():
+    # Test the length of a Dual_x_array
+    test_number = Dual_x_array(np.array([1.0, 2.0, 3.0]), np.array([4.0, 5.0, 6.0]))
+    assert len(test_number) == 3
+
+def test_getitem_adapt():
+    # Test integer indexing returns a scalar Dual_x
+    test_number = Dual_x_array(np.array([1.0, 2.0, 3.0]), np.array([4.0, 5.0, 6.0]))
+    element = test_number[-1]
+    assert isinstance(element, Dual_x)
+    assert element.real == 3.0
+    assert element.dual == 6.0
+
+    # Test slicing returns a view sharing memory with the parent
+    view = test_number[1:]
+    assert np.shares_memory(view.real, test_number.real)
+    assert np.shares_memory(view.dual, test_number.dual)
+    view.real[0] = 10.0
+    assert test_number.real[1] == 10.0
+
+    # Test fancy and boolean indexing gather both parts
+    gathered = test_number[[2, 0]]
+    assert np.all(gathered.real == np.array([3.0, 1.0]))
+    assert np.all(gathered.dual == np.array([6.0, 4.0]))
+    masked = test_number[test_number > 2.5]
+    assert np.all(masked.real == np.array([10.0, 3.0]))
+    assert np.all(masked.dual == np.array([5.0, 6.0]))
+
+    # Test an empty index list selects nothing
+    empty = test_number[[]]
+    assert len(empty) == 0
+
+    # Test IndexError for out of bounds indices
+    with pytest.raises(IndexError, match="out of bounds"):
+        test_number[[0, 3]]
+
+def test_setitem_adapt():
+    # Test scatter through slices, index arrays and masks
+    test_number = Dual_x_array(np.zeros(4), np.zeros(4))
+    test_number[:2] = Dual_x_array(np.array([1.0, 2.0]), np.array([3.0, 4.0]))
+    test_number[[3, 2]] = Dual_x_array(np.array([5.0, 6.0]), np.array([7.0, 8.0]))
+    assert np.all(test_number.real == np.array([1.0, 2.0, 6.0, 5.0]))
+    assert np.all(test_number.dual == np.array([3.0, 4.0, 8.0, 7.0]))
+
+    # Plain values are assigned a zero dual part
+    test_number[test_number > 4.0] = 0.0
+    assert np.all(test_number.real == np.array([1.0, 2.0, 0.0, 0.0]))
+    assert np.all(test_number.dual == np.array([3.0, 4.0, 0.0, 0.0]))
+
+    # Test values viewing the destination are read before being overwritten
+    test_number = Dual_x_array(np.arange(4.0), np.arange(4.0) + 10)
+    test_number[[0, 1, 2, 3]] = test_number[::-1]
+    assert np.all(test_number.real == np.array([3.0, 2.0, 1.0, 0.0]))
+    assert np.all(test_number.dual == np.array([13.0, 12.0, 11.0, 10.0]))
+    test_number[np.ones(4, dtype=bool)] = test_number[::-1]
+    assert np.all(test_number.real == np.array([0.0, 1.0, 2.0, 3.0]))
+
+    # Test a scalar boolean index selects everything or nothing
+    test_number[True] = 1.0
+    assert np.all(test_number.real == np.ones(4))
+    assert len(test_number[True]) == 4
+    assert len(test_number[False]) == 0
+
+def test_reshape_adapt():
+    # Test reshaping to a matrix returns a Dual_x view
+    test_number = Dual_x_array(np.arange(6.0), np.arange(6.0) + 10)
+    matrix = test_number.reshape(2, 3)
+    assert isinstance(matrix, Dual_x)
+    assert matrix.real.shape == (2, 3)
+    assert np.shares_memory(matrix.dual, test_number.dual)
+    assert isinstance(test_number.reshape(-1), Dual_x_array)
+
+def test_concatenate_stack_adapt():
+    # Test concatenation and stacking into a single destination
+    from dual_autodiff_x.dual import concatenate, stack
+    a = Dual_x_array(np.array([1.0, 2.0]), np.array([3.0, 4.0]))
+    b = Dual_x_array(np.array([5.0]), np.array([6.0]))
+    joined = concatenate([a, b, np.array([7.0])])
+    assert isinstance(joined, Dual_x_array)
+    assert np.all(joined.real == np.array([1.0, 2.0, 5.0, 7.0]))
+    assert np.all(joined.dual == np.array([3.0, 4.0, 6.0, 0.0]))
+
+    out = Dual_x(np.empty((2, 2)), np.empty((2, 2)))
+    stacked = stack([a, a], axis=1, out=out)
+    assert stacked is out
+    assert np.all(out.real == np.array([[1.0, 1.0], [2.0, 2.0]]))
+    assert np.all(out.dual == np.array([[3.0, 3.0], [4.0, 4.0]]))
+
+    with pytest.raises(ValueError, match="same shape"):
+        stack([a, b])
+
+def test_buffer_pool_adapt():
+    # Test temporaries are returned to the pool and reused
+    from dual_autodiff_x.dual import BufferPool
+    x = Dual_x_array(np.linspace(1.0, 2.0, 100), np.ones(100))
+    with BufferPool(min_size=1) as pool:
+        y = (x.sin() * x + x.exp()).log()
+        stats = pool.stats()
+        assert stats['reuses'] > 0
+        assert stats['peak_bytes'] > 0
+        assert y.real == pytest.approx(np.log(np.sin(x.real) * x.real + np.exp(x.real)))
+
+        # Test a part kept alive by the caller is never handed out again
+        kept = x.cos().real
+        z = x.sin()
+        assert not np.shares_memory(kept, z.real)
+        assert not np.shares_memory(kept, z.dual)
+        assert kept == pytest.approx(np.cos(x.real))
+
+    # Test leaving the pool releases the free buffers
+    assert pool.stats()['held_bytes'] == 0
+
+def test_buffer_pool_accounting_adapt():
+    # Test parts and slices that outlive their result are accounted for once released
+    from dual_autodiff_x.dual import BufferPool
+    x = Dual_x_array(np.linspace(1.0, 2.0, 100), np.ones(100))
+    with BufferPool(min_size=1) as pool:
+        for _ in range(10):
+            k = x.exp().real
+            s = x.sin()[10:]
+            del k, s
+        stats = pool.stats()
+        assert stats['in_use_bytes'] == 0
+        assert stats['reuses'] > 0
+        assert stats['peak_bytes'] <= 4 * 128 * 8
+
+        # Test results kept alive in bulk are all taken back once dropped
+        kept = [x.sin().real for _ in range(100)]
+        assert all(k == pytest.approx(np.sin(x.real)) for k in kept)
+        del kept
+        assert pool.stats()['in_use_bytes'] == 0
+
+def test_buffer_pool_scope_adapt():
+    # Test a pool only serves the thread that entered it
+    import threading
+    from dual_autodiff_x.dual import BufferPool
+    x = Dual_x_array(np.ones(100), np.ones(100))
+    with BufferPool(min_size=1) as pool:
+        thread = threading.Thread(target=lambda: [x.sin() for _ in range(10)])
+        thread.start()
+        thread.join()
+        assert pool.stats()['requests'] == 0
+        x.sin()
+        assert pool.stats()['requests'] == 2
+
+        # Test nested pools restore the outer one and a pool cannot be entered twice
+        with BufferPool(min_size=1) as inner:
+            x.sin()
+        x.sin()
+        assert inner.stats()['requests'] == 2
+        assert pool.stats()['requests'] == 4
+        with pytest.raises(RuntimeError, match="already active"):
+            with pool:
+                pass
+
+def test_buffer_pool_cap_adapt():
+    # Test the memory cap evicts free buffers
+    from dual_autodiff_x.dual import BufferPool
+    x = Dual_x_array(np.ones(128), np.ones(128))
+    with BufferPool(max_bytes=3 * 128 * 8, min_size=1) as pool:
+        a, b = x.exp(), x.sin()
+        del a, b
+        stats = pool.stats()
+        assert stats['held_bytes'] <= 3 * 128 * 8
+        assert stats['evictions'] == 1
+
+    with pytest.raises(ValueError, match="min_size must be at least 1"):
+        BufferPool(min_size=0)
@@ -0,0 +1,164 @@
+import pytest
+import numpy as np
+from dual_autodiff_x.dual import Dual_x
+from dual_autodiff_x.dual import Dual_x_array
+from dual_autodiff_x import linalg
+
+# Tests for the dual linear algebra routines
+
+
+def test_sum():
+    # Test sum of a Dual_x_array over all elements
+    test_number = Dual_x_array(np.array([1.0, 2.0, 3.0]), np.array([4.0, 5.0, 6.0]))
+    total = linalg.sum(test_number)
+    assert isinstance(total, Dual_x)
+    assert total.real == 6.0
+    assert total.dual == 15.0
+
+def test_sum_axis():
+    # Test sum of a dual matrix along an axis returns a Dual_x_array
+    test_matrix = Dual_x(np.array([[1.0, 2.0], [3.0, 4.0]]), np.array([[1.0, 0.0], [0.0, 1.0]]))
+    total = linalg.sum(test_matrix, axis=0)
+    assert isinstance(total, Dual_x_array)
+    assert np.all(total.real == np.array([4.0, 6.0]))
+    assert np.all(total.dual == np.array([1.0, 1.0]))
+
+def test_mean():
+    # Test mean of a Dual_x_array
+    test_number = Dual_x_array(np.array([1.0, 2.0, 3.0]), np.array([4.0, 5.0, 6.0]))
+    average = linalg.mean(test_number)
+    assert average.real == pytest.approx(2.0)
+    assert average.dual == pytest.approx(5.0)
+
+def test_dot():
+    # Test dot product follows the product rule
+    a = Dual_x_array(np.array([1.0, 2.0]), np.array([3.0, 4.0]))
+    b = Dual_x_array(np.array([5.0, 6.0]), np.array([7.0, 8.0]))
+    product = linalg.dot(a, b)
+    assert product.real == 1.0 * 5.0 + 2.0 * 6.0
+    assert product.dual == (1.0 * 7.0 + 2.0 * 8.0) + (3.0 * 5.0 + 4.0 * 6.0)
+
+def test_dot_constant():
+    # Test dot product with a plain array treated as a constant
+    a = Dual_x_array(np.array([1.0, 2.0]), np.array([3.0, 4.0]))
+    product = linalg.dot(a, np.array([5.0, 6.0]))
+    assert product.real == 17.0
+    assert product.dual == 39.0
+
+def test_matmul():
+    # Test matrix product against the elementwise dual formula
+    rng = np.random.default_rng(0)
+    A, dA, B, dB = (rng.standard_normal((3, 3)) for _ in range(4))
+    product = linalg.matmul(Dual_x(A, dA), Dual_x(B, dB))
+    assert product.real == pytest.approx(A @ B)
+    assert product.dual == pytest.approx(A @ dB + dA @ B)
+
+def test_matmul_operator():
+    # Test the @ operator dispatches to matmul, with a matrix-vector product returning a Dual_x_array
+    A = Dual_x(np.array([[1.0, 2.0], [3.0, 4.0]]), np.array([[0.0, 1.0], [1.0, 0.0]]))
+    x = Dual_x_array(np.array([1.0, 1.0]), np.array([1.0, 0.0]))
+    product = A @ x
+    assert isinstance(product, Dual_x_array)
+    assert np.all(product.real == np.array([3.0, 7.0]))
+    assert np.all(product.dual == np.array([1.0, 3.0]) + np.array([1.0, 1.0]))
+
+    # Test a plain matrix on the left is treated as a constant
+    product = np.array([[1.0, 2.0], [3.0, 4.0]]) @ x
+    assert isinstance(product, Dual_x_array)
+    assert np.all(product.real == np.array([3.0, 7.0]))
+    assert np.all(product.dual == np.array([1.0, 3.0]))
+    assert np.all(np.matmul(np.eye(2), x).real == x.real)
+
+def test_numpy_ufuncs():
+    # Test NumPy's elementary ufuncs dispatch to the dual methods
+    scalar = np.sin(Dual_x(0.5, 1.0))
+    assert isinstance(scalar, Dual_x)
+    assert scalar.real == pytest.approx(np.sin(0.5))
+    assert scalar.dual == pytest.approx(np.cos(0.5))
+    matrix = np.exp(Dual_x(np.ones((2, 2)), np.ones((2, 2))))
+    assert matrix.dual == pytest.approx(np.full((2, 2), np.e))
+    array = np.log(Dual_x_array(np.array([1.0, 2.0]), np.array([1.0, 1.0])))
+    assert isinstance(array, Dual_x_array)
+    assert array.dual == pytest.approx(np.array([1.0, 0.5]))
+    with pytest.raises(TypeError):
+        np.sqrt(Dual_x(4.0, 1.0))
+
+def test_outer():
+    # Test outer product of two dual vectors
+    a = Dual_x_array(np.array([1.0, 2.0]), np.array([1.0, 0.0]))
+    b = Dual_x_array(np.array([3.0, 4.0]), np.array([0.0, 1.0]))
+    product = linalg.outer(a, b)
+    assert np.all(product.real == np.outer(a.real, b.real))
+    assert np.all(product.dual == np.outer(a.real, b.dual) + np.outer(a.dual, b.real))
+
+def test_norm():
+    # Test Euclidean norm and its derivative
+    test_number = Dual_x_array(np.array([3.0, 4.0]), np.array([1.0, 0.0]))
+    n = linalg.norm(test_number)
+    assert n.real == pytest.approx(5.0)
+    assert n.dual == pytest.approx(3.0 / 5.0)
+
+    # Test ValueError for the zero vector
+    zero = Dual_x_array(np.array([0.0, 0.0]), np.array([1.0, 0.0]))
+    with pytest.raises(ValueError, match="Norm derivative undefined"):
+        linalg.norm(zero)
+
+def test_solve():
+    # Test the tangent of the solution against the analytic formula dx = A^-1 (db - dA x)
+    rng = np.random.default_rng(1)
+    A = rng.standard_normal((4, 4)) + 4 * np.eye(4)
+    dA = rng.standard_normal((4, 4))
+    b = rng.standard_normal(4)
+    db = rng.standard_normal(4)
+    x = linalg.solve(Dual_x(A, dA), Dual_x_array(b, db))
+    expected_real = np.linalg.solve(A, b)
+    expected_dual = np.linalg.solve(A, db - dA @ expected_real)
+    assert isinstance(x, Dual_x_array)
+    assert x.real == pytest.approx(expected_real)
+    assert x.dual == pytest.approx(expected_dual)
+
+def test_solve_batched():
+    # Test batched solves of shape (B, n, n) match per-matrix solves
+    rng = np.random.default_rng(2)
+    A = rng.standard_normal((5, 3, 3)) + 3 * np.eye(3)
+    dA = rng.standard_normal((5, 3, 3))
+    b = rng.standard_normal((5, 3))
+    x = linalg.solve(Dual_x(A, dA), b)
+    for i in range(5):
+        expected_real = np.linalg.solve(A[i], b[i])
+        assert x.real[i] == pytest.approx(expected_real)
+        assert x.dual[i] == pytest.approx(np.linalg.solve(A[i], -dA[i] @ expected_real))
+
+def test_cholesky_solve():
+    # Test the Cholesky solve agrees with the LU solve on a symmetric positive definite matrix
+    rng = np.random.default_rng(3)
+    M = rng.standard_normal((4, 4))
+    A = M @ M.T + 4 * np.eye(4)
+    dM = rng.standard_normal((4, 4))
+    dA = dM + dM.T
+    b = Dual_x_array(rng.standard_normal(4), rng.standard_normal(4))
+    x = linalg.cholesky_solve(Dual_x(A, dA), b)
+    expected = linalg.solve(Dual_x(A, dA), b)
+    assert x.real == pytest.approx(expected.real)
+    assert x.dual == pytest.approx(expected.dual)
+
+def test_lstsq():
+    # Test the least-squares tangent against a central finite difference
+    rng = np.random.default_rng(4)
+    A = rng.standard_normal((6, 3))
+    dA = rng.standard_normal((6, 3))
+    b = rng.standard_normal(6)
+    db = rng.standard_normal(6)
+    x = linalg.lstsq(Dual_x(A, dA), Dual_x_array(b, db))
+    h = 1e-6
+    plus = np.linalg.lstsq(A + h * dA, b + h * db, rcond=None)[0]
+    minus = np.linalg.lstsq(A - h * dA, b - h * db, rcond=None)[0]
+    assert x.real == pytest.approx(np.linalg.lstsq(A, b, rcond=None)[0])
+    assert x.dual == pytest.approx((plus - minus) / (2 * h), rel=1e-5)
+
+def test_solve_singular():
+    # Test a singular real part raises LinAlgError instead of propagating infs
+    A = Dual_x(np.array([[1.0, 2.0], [2.0, 4.0]]), np.eye(2))
+    b = Dual_x_array(np.array([1.0, 2.0]), np.array([0.0, 1.0]))
+    with pytest.raises(np.linalg.LinAlgError, match="Singular matrix"):
+        linalg.solve(A, b)
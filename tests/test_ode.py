@@ -0,0 +1,64 @@
+import pytest
+import numpy as np
+from dual_autodiff_x.dual import Dual_x
+from dual_autodiff_x.dual import Dual_x_array
+from dual_autodiff_x import ode
+
+# Tests for the batched ODE integrators with forward sensitivities
+
+
+def decay(t, y, p):
+    # dy/dt = -p y, solved by y0 exp(-p t)
+    return Dual_x_array(-p.real * y.real, -(p.dual * y.real + p.real * y.dual))
+
+def oscillator(t, y, omega):
+    # Harmonic oscillator with state (position, velocity) along the last axis
+    return Dual_x(
+        np.stack([y.real[:, 1], -omega ** 2 * y.real[:, 0]], axis=1),
+        np.stack([y.dual[:, 1], -omega ** 2 * y.dual[:, 0]], axis=1)
+    )
+
+def test_rk4():
+    # Test a batch of decays and their sensitivity to the rate parameter
+    y0 = np.linspace(1.0, 2.0, 5)
+    p = Dual_x_array(np.linspace(0.5, 1.5, 5), np.ones(5))
+    t = np.linspace(0.0, 1.0, 11)
+    trajectory = ode.rk4(decay, Dual_x_array(y0, np.zeros(5)), t, args=(p,), substeps=10)
+    assert trajectory.real.shape == (11, 5)
+    expected_real = y0 * np.exp(-np.outer(t, p.real))
+    expected_dual = -t[:, None] * expected_real
+    assert trajectory.real == pytest.approx(expected_real, rel=1e-8)
+    assert trajectory.dual == pytest.approx(expected_dual, rel=1e-7, abs=1e-12)
+
+def test_rk4_matrix_state():
+    # Test a batch of vector-valued states, seeding the dual part with the initial position
+    y0 = Dual_x(np.array([[1.0, 0.0], [2.0, 0.0]]), np.array([[1.0, 0.0], [1.0, 0.0]]))
+    t = np.array([0.0, np.pi / 2, np.pi])
+    trajectory = ode.rk4(oscillator, y0, t, args=(1.0,), substeps=200)
+    assert trajectory.real[-1, :, 0] == pytest.approx(np.array([-1.0, -2.0]), rel=1e-8)
+    assert trajectory.dual[-1, :, 0] == pytest.approx(np.array([-1.0, -1.0]), rel=1e-8)
+
+def test_rk45():
+    # Test the adaptive integrator reaches the requested tolerance on the solution and sensitivity
+    y0 = np.linspace(1.0, 2.0, 1000)
+    p = Dual_x_array(np.linspace(0.5, 1.5, 1000), np.ones(1000))
+    t = np.array([0.0, 0.5, 2.0])
+    trajectory = ode.rk45(decay, y0, t, args=(p,), rtol=1e-10, atol=1e-12)
+    expected_real = y0 * np.exp(-np.outer(t, p.real))
+    assert trajectory.real == pytest.approx(expected_real, rel=1e-8)
+    assert trajectory.dual == pytest.approx(-t[:, None] * expected_real, rel=1e-7, abs=1e-12)
+
+def test_invalid_times():
+    # Test ValueError for times that are not strictly increasing
+    y0 = Dual_x_array(np.array([1.0]), np.array([0.0]))
+    with pytest.raises(ValueError, match="strictly increasing"):
+        ode.rk4(decay, y0, np.array([0.0, 1.0, 1.0]), args=(y0,))
+
+def test_rk45_stiff_member():
+    # Test one fast trajectory in a large batch still meets its tolerance
+    rates = np.full(1000, 0.5)
+    rates[0] = 50.0
+    p = Dual_x_array(rates, np.zeros(1000))
+    t = np.array([0.0, 0.2])
+    trajectory = ode.rk45(decay, np.ones(1000), t, args=(p,), rtol=1e-6, atol=1e-12)
+    assert trajectory.real[-1, 0] == pytest.approx(np.exp(-50.0 * 0.2), rel=1e-5)
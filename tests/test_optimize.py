@@ -0,0 +1,134 @@
+import pytest
+import numpy as np
+from dual_autodiff_x.dual import Dual_x
+from dual_autodiff_x.dual import Dual_x_array
+from dual_autodiff_x import linalg
+from dual_autodiff_x.optimize import DualObjective, minimize
+
+# Tests for the scipy.optimize adapter
+
+
+def rosenbrock(x):
+    # Rosenbrock function of a 2D dual input
+    a = Dual_x(1.0 - x.real[0], -x.dual[0])
+    b = Dual_x(x.real[1] - x.real[0] ** 2, x.dual[1] - 2 * x.real[0] * x.dual[0])
+    return a * a + Dual_x(100.0, 0.0) * b * b
+
+def quadratic(x):
+    # Sum of squares, reducing over axis 0 so it also works in vectorized mode
+    return linalg.sum(x * x, axis=0 if isinstance(x, Dual_x) else None)
+
+def test_fun_jac_share_evaluation():
+    # Test fun and jac at the same point evaluate the function once
+    objective = DualObjective(rosenbrock)
+    x = np.array([-1.2, 1.0])
+    value = objective.fun(x)
+    grad = objective.jac(x)
+    assert value == pytest.approx(2.2 ** 2 + 100 * 0.44 ** 2)
+    assert grad == pytest.approx(np.array([-2 * 2.2 - 400 * -1.2 * -0.44, 200 * -0.44]))
+    assert objective.cache_info() == {'hits': 1, 'misses': 1, 'size': 1, 'max_size': 8}
+
+def test_cache_eviction():
+    # Test the least recently used point is evicted
+    objective = DualObjective(quadratic, cache_size=2)
+    objective.fun(np.array([1.0, 1.0]))
+    objective.fun(np.array([2.0, 2.0]))
+    objective.fun(np.array([1.0, 1.0]))
+    objective.fun(np.array([3.0, 3.0]))  # Evicts [2, 2]
+    objective.fun(np.array([2.0, 2.0]))
+    assert objective.hits == 1
+    assert objective.misses == 4
+
+    objective.cache_clear()
+    assert objective.cache_info() == {'hits': 0, 'misses': 0, 'size': 0, 'max_size': 2}
+    with pytest.raises(ValueError, match="cache_size must be at least 1"):
+        DualObjective(quadratic, cache_size=0)
+
+def test_vectorized():
+    # Test the single-call vectorized mode gives the same gradient
+    x = np.array([1.0, -2.0, 3.0])
+    value, grad = DualObjective(quadratic, vectorized=True).value_and_grad(x)
+    assert value == pytest.approx(14.0)
+    assert grad == pytest.approx(2 * x)
+
+def test_hessp():
+    # Test the Hessian-vector product of a quadratic
+    objective = DualObjective(quadratic)
+    hp = objective.hessp(np.array([1.0, 2.0]), np.array([1.0, -1.0]))
+    assert hp == pytest.approx(np.array([2.0, -2.0]), rel=1e-5)
+
+def test_minimize():
+    # Test minimizing the Rosenbrock function through scipy
+    result = minimize(rosenbrock, np.array([-1.2, 1.0]), method='BFGS', options={'gtol': 1e-8})
+    assert result.x == pytest.approx(np.array([1.0, 1.0]), rel=1e-5)
+    assert result.cache_info['hits'] > 0
+
+    result = minimize(rosenbrock, np.array([-1.2, 1.0]), method='Newton-CG')
+    assert result.x == pytest.approx(np.array([1.0, 1.0]), rel=1e-4)
+
+def test_fixed_point():
+    # Test a batch of fixed points x = p cos(x) and their derivatives with respect to p
+    from dual_autodiff_x.optimize import fixed_point
+    p = Dual_x_array(np.linspace(0.1, 0.9, 50), np.ones(50))
+    solution = fixed_point(
+        lambda x, p: p * x.cos(), np.zeros(50), args=(p,), g_real=lambda x, p: p * np.cos(x)
+    )
+    assert isinstance(solution, Dual_x_array)
+    x = solution.real
+    assert x == pytest.approx(p.real * np.cos(x))
+    # Implicit derivative of x - p cos(x) = 0
+    assert solution.dual == pytest.approx(np.cos(x) / (1 + p.real * np.sin(x)))
+
+    # Test the iterations can run on g itself when it is written with dual methods
+    default = fixed_point(lambda x, p: p * x.cos(), np.zeros(50), args=(p,))
+    assert default.real == pytest.approx(x)
+    assert default.dual == pytest.approx(solution.dual)
+
+def test_root():
+    # Test a batch of square roots and their derivatives
+    from dual_autodiff_x.optimize import root
+    p = Dual_x_array(np.array([1.0, 4.0, 9.0]), np.array([1.0, 1.0, 2.0]))
+    solution = root(lambda x, p: x * x - p, np.ones(3), args=(p,))
+    assert solution.real == pytest.approx(np.array([1.0, 2.0, 3.0]))
+    assert solution.dual == pytest.approx(p.dual / (2 * np.sqrt(p.real)))
+
+    # Test a scalar problem returns a Dual_x and non-convergence raises
+    scalar = root(lambda x, p: x * x - p, 1.0, args=(Dual_x_array(np.array([2.0]), np.array([1.0])),))
+    assert isinstance(scalar, Dual_x)
+    assert scalar.real == pytest.approx(np.sqrt(2.0))
+    with pytest.raises(RuntimeError, match="did not converge"):
+        root(lambda x, p: x * x - p, np.ones(3), args=(p,), max_iter=2)
+
+    # Test large roots converge although their residual cannot reach the absolute tolerance
+    p = Dual_x_array(np.array([123456.789, 7e12]), np.array([1.0, 1.0]))
+    solution = root(lambda x, p: x * x - p, np.array([450.0, 2e6]), args=(p,))
+    assert solution.real == pytest.approx(np.sqrt(p.real), rel=1e-12)
+    assert solution.dual == pytest.approx(1.0 / (2 * np.sqrt(p.real)))
+
+def test_scalar_dual_args():
+    # Test a scalar Dual_x parameter is shared by every problem in the batch
+    from dual_autodiff_x.optimize import fixed_point, root
+    scalar = root(lambda x, p: x * x - p, 1.0, args=(Dual_x(2.0, 1.0),))
+    assert scalar.real == pytest.approx(np.sqrt(2.0))
+    assert scalar.dual == pytest.approx(1.0 / (2.0 * np.sqrt(2.0)))
+
+    shift = Dual_x(1.0, 1.0)
+    p = Dual_x_array(np.array([3.0, 8.0]), np.zeros(2))
+    solution = root(lambda x, p, s: x * x - p - s, np.ones(2), args=(p, shift))
+    assert solution.real == pytest.approx(np.array([2.0, 3.0]))
+    assert solution.dual == pytest.approx(np.array([1.0 / 4.0, 1.0 / 6.0]))
+
+    p = Dual_x(0.5, 1.0)
+    point = fixed_point(lambda x, p: p * x.cos(), np.zeros(3), args=(p,))
+    assert point.real == pytest.approx(0.5 * np.cos(point.real))
+    assert point.dual == pytest.approx(np.cos(point.real) / (1 + 0.5 * np.sin(point.real)))
+
+def test_minimize_user_jac():
+    # Test a user-supplied jac replaces the adapter's
+    calls = []
+    def jac(x):
+        calls.append(1)
+        return 2 * x
+    result = minimize(quadratic, np.array([1.0, -1.0]), jac=jac)
+    assert result.x == pytest.approx(np.zeros(2), abs=1e-6)
+    assert calls